@@ -1,22 +1,68 @@
 """Main application orchestrator for WWM Auto-Bard."""
 
+import array
+import ctypes
 import logging
 import time
 import threading
 import random
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import accumulate, cycle, repeat
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, NamedTuple, Sequence, Tuple, Union
 
 from .config.settings import AppConfig
-from .models import PlaybackState, NoteEvent, SongInfo
-from .core import KeyMapper, NoteConverter, Transposer
-from .core.compiled_song import CompiledSong
+from .models import KeyPress, PlaybackState, NoteEvent, SongInfo
+from .core import KeyMapper, NoteConverter, Transposer, RangeStats, scan_range
+from .core.compiled_song import CompiledSong, find_chord_groups, note_density
 from .core.precision_timer import PrecisionTimer, precision_sleep
 from .services import MidiService, KeyboardService, HotkeyService
 from .services.sky_sheet_service import SkySheetService
 
 logger = logging.getLogger(__name__)
 
+# Windows thread priority API, bound once at import
+_THREAD_SET_INFORMATION = 0x0020
+_THREAD_PRIORITY_HIGHEST = 2
+try:
+    from ctypes import wintypes
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _OpenThread = _kernel32.OpenThread
+    _OpenThread.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _OpenThread.restype = wintypes.HANDLE
+    _SetThreadPriority = _kernel32.SetThreadPriority
+    _SetThreadPriority.argtypes = [wintypes.HANDLE, ctypes.c_int]
+    _SetThreadPriority.restype = wintypes.BOOL
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+    _HAS_KERNEL32 = True
+except (OSError, AttributeError, ImportError, ValueError):
+    _HAS_KERNEL32 = False
+
+# Max number of pre-generated humanization offsets per playback
+JITTER_BUFFER_SIZE = 4096
+
+# Max number of songs kept prepared ahead of playlist transitions
+PRELOAD_CACHE_SIZE = 2
+
+# Min seconds between progress/time notifications during playback (~30 Hz)
+NOTIFY_INTERVAL = 1 / 30
+
+
+class _PreparedSong(NamedTuple):
+    """A parsed and compiled song that has not been applied yet."""
+    events: Tuple[NoteEvent, ...]
+    chord_groups: List[Tuple[int, int]]
+    file_type: str
+    service: Union[MidiService, SkySheetService]  # The service that parsed the file
+    song_info: Optional[SongInfo]
+    original_count: int
+    note_range: Optional[RangeStats]
+    transpose_offset: int
+    compiled_song: CompiledSong
+
 
 class AutoBardApp:
     """Main application controller - orchestrates all components.
@@ -41,6 +87,7 @@ class AutoBardApp:
         self._precision_timer = PrecisionTimer()
         self._current_file_type = "midi"  # "midi" or "sky"
         self._compiled_song: Optional[CompiledSong] = None  # Pre-compiled for playback
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autobard-loader")
         
         # Initialize core logic
         self._key_mapper = KeyMapper()
@@ -49,11 +96,14 @@ class AutoBardApp:
         
         # State
         self._state = PlaybackState.READY
-        self._events: List[NoteEvent] = []
+        self._events: Tuple[NoteEvent, ...] = ()  # Immutable; swapped atomically on load
+        self._chord_group_cache: Tuple[Tuple[NoteEvent, ...], List[Tuple[int, int]]] = ((), [])
         self._transpose_offset = 0
         self._playback_thread: Optional[threading.Thread] = None
         self._stop_flag = threading.Event()
         self._pause_flag = threading.Event()
+        self._resume_flag = threading.Event()  # Cleared while paused; playback blocks on it
+        self._resume_flag.set()
         
         # Playback position tracking
         self._current_position: int = 0  # Current note index
@@ -64,12 +114,18 @@ class AutoBardApp:
         # Queue/Playlist
         self._playlist: List[Path] = []
         self._playlist_index: int = 0
+        self._preloaded: "OrderedDict[Tuple[Path, bool], _PreparedSong]" = OrderedDict()  # LRU
+        self._preloading: set = set()
+        self._preload_generation = 0  # Bumped by clear_playlist; stale results are dropped
+        self._preload_lock = threading.Lock()
         
-        # Observers for state changes
-        self._state_callbacks: List[Callable[[PlaybackState], None]] = []
-        self._progress_callbacks: List[Callable[[int, int], None]] = []
-        self._time_callbacks: List[Callable[[float, float], None]] = []  # current_time, total_time
-        self._countdown_callbacks: List[Callable[[int], None]] = []  # countdown seconds
+        # Observers for state changes. Stored as tuples and replaced on
+        # registration, so notifiers can iterate without copying or locking.
+        self._state_callbacks: Tuple[Callable[[PlaybackState], None], ...] = ()
+        self._progress_callbacks: Tuple[Callable[[int, int], None], ...] = ()
+        self._time_callbacks: Tuple[Callable[[float, float], None], ...] = ()  # current_time, total_time
+        self._countdown_callbacks: Tuple[Callable[[int], None], ...] = ()  # countdown seconds
+        self._load_callbacks: Tuple[Callable[[Path, bool], None], ...] = ()  # path, success
         
         # Setup hotkeys
         self._setup_hotkeys()
@@ -104,76 +160,191 @@ class AutoBardApp:
     def load_midi(self, path: Path) -> bool:
         """Load a music file for playback (MIDI or Sky sheet).
         
+        Notifies load observers when done.
+        
         Args:
             path: Path to the .mid or .json file
             
         Returns:
             True if loaded successfully
         """
-        try:
-            # Detect file type
-            suffix = path.suffix.lower()
-            is_sky = suffix in ('.json', '.skysheet', '.txt') or SkySheetService.is_sky_sheet(path)
-            
-            if is_sky:
-                self._events = self._sky_service.load_file(path)
-                song_info = self._sky_service.get_song_info()
-                self._current_file_type = "sky"
-                logger.info(f"Loaded Sky sheet: {path.name}")
-            else:
-                self._events = self._midi_service.load_file(path)
-                song_info = self._midi_service.get_song_info()
-                self._current_file_type = "midi"
-            
-            # Filter to note-on events only for playback
-            self._events = [e for e in self._events if e.is_note_on]
-            
-            original_count = len(self._events)
+        success = self._load_file(path)
+        self._notify_load(path, success)
+        return success
+    
+    def load_midi_async(self, path: Path) -> Future:
+        """Load a music file on the background loader thread.
+        
+        Parsing, range optimization and compilation run off the caller's
+        thread; observers registered with on_load_complete are notified
+        from the loader thread when done.
+        
+        Args:
+            path: Path to the .mid or .json file
             
-            # Auto-optimize if enabled and song is too wide
-            if self._config.auto_optimize and self._events:
-                notes = [e.note for e in self._events]
-                span = max(notes) - min(notes)
-                if span > 36:
-                    # Find best window and filter
-                    window_start, window_count = self._transposer.find_best_window(self._events)
-                    self._events = self._transposer.filter_to_window(self._events, window_start)
-                    logger.info(f"  Auto-optimized: kept {len(self._events)}/{original_count} notes in best range")
-            
-            # Calculate transpose offset based on filtered events
-            if self._events:
-                min_note = min(e.note for e in self._events)
-                max_note = max(e.note for e in self._events)
-                self._transpose_offset = self._transposer.calculate_offset((min_note, max_note))
+        Returns:
+            Future resolving to True if loaded successfully
+        """
+        return self._loader.submit(self.load_midi, path)
+    
+    def _load_file(self, path: Path) -> bool:
+        """Load a music file into the playback state, using a preload if available."""
+        try:
+            with self._preload_lock:
+                prepared = self._preloaded.pop(self._preload_key(path), None)
+            if prepared is None:
+                prepared = self._prepare_song(path)
             else:
-                self._transpose_offset = 0
-            
-            # Pre-compile song for optimized playback
-            self._compiled_song = CompiledSong.compile(
-                self._events,
-                self._transpose_offset,
-                self._note_converter,
-                self._key_mapper
-            )
-            
-            # Log song info for debugging
-            if song_info:
-                logger.info(f"Loaded: {song_info.filename}")
-                logger.info(f"  Original: {original_count} notes, Range: MIDI {song_info.min_note}-{song_info.max_note} (span: {song_info.max_note - song_info.min_note})")
-                if self._events:
-                    new_min = min(e.note for e in self._events)
-                    new_max = max(e.note for e in self._events)
-                    logger.info(f"  Playing: {len(self._events)} notes, Range: MIDI {new_min}-{new_max} (span: {new_max - new_min})")
-                logger.info(f"  Transpose: {self._transpose_offset:+d} semitones")
-                logger.info(f"  Pre-compiled: {self._compiled_song.total_notes} playable notes")
-            
-            self._set_state(PlaybackState.READY)
+                logger.info("Using preloaded song: %s", path.name)
+            self._apply_prepared(prepared)
             return True
             
         except Exception as e:
             logger.error(f"Failed to load file: {e}")
             return False
     
+    def _prepare_song(self, path: Path) -> _PreparedSong:
+        """Parse, optimize and compile a music file without touching playback state.
+        
+        The file is parsed by a new service instance, so loads and preloads
+        on the loader thread never mutate the service the UI is reading;
+        _apply_prepared() publishes it.
+        
+        Args:
+            path: Path to the .mid or .json file
+            
+        Returns:
+            The prepared song, ready to be applied
+        """
+        # Detect file type
+        suffix = path.suffix.lower()
+        is_sky = suffix in ('.json', '.skysheet', '.txt') or SkySheetService.is_sky_sheet(path)
+        
+        service: Union[MidiService, SkySheetService]
+        if is_sky:
+            sky_service = SkySheetService()
+            events = sky_service.load_file(path)
+            song_info = sky_service.get_song_info()
+            file_type, service = "sky", sky_service
+            logger.info(f"Loaded Sky sheet: {path.name}")
+        else:
+            midi_service = MidiService()
+            events = midi_service.load_file(path)
+            song_info = midi_service.get_song_info()
+            file_type, service = "midi", midi_service
+        
+        # Filter to note-on events only for playback
+        note_on_events = self._note_on_events(events)
+        
+        original_count = len(note_on_events)
+        
+        # One range, shared by the span check, window search and offset; the
+        # loader already measured it unless the filter above dropped events
+        if note_on_events is events:
+            note_range = self._loader_range(events, song_info)
+        else:
+            note_range = scan_range(note_on_events)
+        events = note_on_events
+        
+        # Auto-optimize if enabled and song is too wide
+        if self._config.auto_optimize and note_range:
+            span = note_range.max_note - note_range.min_note
+            if span > 36:
+                # Find best window and filter
+                window_start, window_count = self._transposer.find_best_window(events, note_range)
+                events = self._transposer.filter_to_window(events, window_start)
+                note_range = scan_range(events)
+                logger.info(f"  Auto-optimized: kept {len(events)}/{original_count} notes in best range")
+        
+        # Calculate transpose offset based on filtered events
+        if note_range:
+            transpose_offset = self._transposer.calculate_offset(note_range)
+        else:
+            transpose_offset = 0
+        
+        # Group chords once; shared by the compiler and standard playback
+        events = tuple(events)
+        chord_groups = find_chord_groups(events)
+        
+        # Pre-compile song for optimized playback
+        compiled_song = CompiledSong.compile(
+            events,
+            transpose_offset,
+            self._note_converter,
+            self._key_mapper,
+            chord_groups=chord_groups
+        )
+        
+        return _PreparedSong(events, chord_groups, file_type, service, song_info, original_count,
+                             note_range, transpose_offset, compiled_song)
+    
+    def _apply_prepared(self, prepared: _PreparedSong) -> None:
+        """Swap a prepared song into the playback state."""
+        self._events = prepared.events
+        self._chord_group_cache = (prepared.events, prepared.chord_groups)
+        self._current_file_type = prepared.file_type
+        self._transpose_offset = prepared.transpose_offset
+        self._compiled_song = prepared.compiled_song
+        
+        # Keep the service that parsed the file so track info stays consistent
+        service = prepared.service
+        if isinstance(service, SkySheetService):
+            self._sky_service = service
+        else:
+            self._midi_service = service
+        
+        # Log song info for debugging
+        song_info = prepared.song_info
+        if song_info:
+            logger.info(f"Loaded: {song_info.filename}")
+            logger.info(f"  Original: {prepared.original_count} notes, Range: MIDI {song_info.min_note}-{song_info.max_note} (span: {song_info.max_note - song_info.min_note})")
+            if prepared.note_range:
+                new_min, new_max = prepared.note_range.min_note, prepared.note_range.max_note
+                logger.info(f"  Playing: {len(self._events)} notes, Range: MIDI {new_min}-{new_max} (span: {new_max - new_min})")
+            logger.info(f"  Transpose: {self._transpose_offset:+d} semitones")
+            logger.info(f"  Pre-compiled: {self._compiled_song.total_notes} playable notes")
+        
+        self._set_state(PlaybackState.READY)
+    
+    def _maybe_preload_next(self) -> None:
+        """Start preparing the next playlist entry on the loader thread."""
+        next_index = self._playlist_index + 1
+        if next_index >= len(self._playlist):
+            return
+        
+        path = self._playlist[next_index]
+        key = self._preload_key(path)
+        with self._preload_lock:
+            if key in self._preloaded or key in self._preloading:
+                return
+            self._preloading.add(key)
+            generation = self._preload_generation
+        self._loader.submit(self._preload_song, path, key, generation)
+    
+    def _preload_key(self, path: Path) -> Tuple[Path, bool]:
+        """Cache key for a prepared song: the file plus config that shapes it."""
+        return (path, self._config.auto_optimize)
+    
+    def _preload_song(self, path: Path, key: Tuple[Path, bool], generation: int) -> None:
+        """Prepare a song and cache it for the next transition."""
+        try:
+            prepared = self._prepare_song(path)
+        except Exception as e:
+            logger.warning("Failed to preload %s: %s", path.name, e)
+            prepared = None
+        
+        # Store and clear the in-flight marker together, so no second
+        # preload of the same key can start in between
+        with self._preload_lock:
+            self._preloading.discard(key)
+            if prepared is None or generation != self._preload_generation:
+                return  # Failed, or the playlist was cleared meanwhile
+            self._preloaded[key] = prepared
+            self._preloaded.move_to_end(key)
+            while len(self._preloaded) > PRELOAD_CACHE_SIZE:
+                self._preloaded.popitem(last=False)
+        logger.debug("Preloaded next song: %s", path.name)
+    
     def start(self) -> None:
         """Start or resume playback."""
         if not self._events and not self._compiled_song:
@@ -186,6 +357,7 @@ class AutoBardApp:
         if self._state == PlaybackState.PAUSED:
             # Resume from paused position
             self._pause_flag.clear()
+            self._resume_flag.set()
             self._set_state(PlaybackState.PLAYING)
             return
         
@@ -197,6 +369,7 @@ class AutoBardApp:
         # Start new playback
         self._stop_flag.clear()
         self._pause_flag.clear()
+        self._resume_flag.set()
         
         # Use optimized or standard playback
         target = self._play_with_countdown
@@ -208,15 +381,15 @@ class AutoBardApp:
         self._playback_thread.start()
         
         # Set high priority for playback thread (Windows)
-        try:
-            import ctypes
-            handle = ctypes.windll.kernel32.OpenThread(0x0020, False, self._playback_thread.ident)
-            if handle:
-                ctypes.windll.kernel32.SetThreadPriority(handle, 2)  # ABOVE_NORMAL
-                ctypes.windll.kernel32.CloseHandle(handle)
-                logger.debug("Set playback thread to high priority")
-        except Exception:
-            pass
+        if _HAS_KERNEL32:
+            try:
+                handle = _OpenThread(_THREAD_SET_INFORMATION, False, self._playback_thread.native_id)
+                if handle:
+                    _SetThreadPriority(handle, _THREAD_PRIORITY_HIGHEST)
+                    _CloseHandle(handle)
+                    logger.debug("Set playback thread to high priority")
+            except Exception:
+                pass
     
     def _play_with_countdown(self) -> None:
         """Wrapper that handles countdown before playback."""
@@ -259,6 +432,7 @@ class AutoBardApp:
         if self._state != PlaybackState.PLAYING:
             return
         
+        self._resume_flag.clear()
         self._pause_flag.set()
         self._start_position = self._current_position  # Remember position
         self._set_state(PlaybackState.PAUSED)
@@ -268,6 +442,7 @@ class AutoBardApp:
         """Stop playback and release all keys (panic button)."""
         self._stop_flag.set()
         self._pause_flag.clear()
+        self._resume_flag.set()  # Wake a paused playback thread so it can exit
         
         # Release all held keys immediately
         self._keyboard_service.release_all()
@@ -352,6 +527,10 @@ class AutoBardApp:
         """Clear the playlist."""
         self._playlist = []
         self._playlist_index = 0
+        with self._preload_lock:
+            self._preload_generation += 1
+            self._preloaded.clear()
+            self._preloading.clear()
     
     def next_song(self) -> bool:
         """Skip to next song in playlist."""
@@ -380,53 +559,58 @@ class AutoBardApp:
         - High-precision timing
         """
         # Copy events to avoid race conditions when user loads new file
-        events = list(self._events)
+        events = self._events  # Immutable snapshot, no copy needed
         total_events = len(events)
         if total_events == 0:
             return
             
         min_delay = self._config.min_note_delay_ms / 1000.0
-        chord_threshold = 0.05  # 50ms - notes within this are treated as chord
         
-        # Pre-calculate note density for dynamic tempo (notes per second in 2s windows)
-        density_map = self._calculate_density_map(events) if self._config.dynamic_tempo else {}
+        # Chord groups are computed once per event list (usually at load time)
+        chord_groups = self._get_chord_groups(events)
+        
+        # Per-group delays with dynamic tempo and velocity timing resolved up front
+        delays = self._group_delays(events, chord_groups)
+        
+        # Pre-generated humanization offsets (cycled through during playback)
+        next_jitter = self._jitter_source(total_events)
+        
+        # Bind hot attributes to locals once; the loop below runs per note.
+        # Config is still read per note for values the UI can change mid-song.
+        config = self._config
+        stop_set = self._stop_flag.is_set
+        pause_set = self._pause_flag.is_set
+        resume_wait = self._resume_flag.wait
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        convert = self._note_converter.convert
+        get_key_press = self._key_mapper.get_key_press
+        press = self._keyboard_service.press
+        press_multiple = self._keyboard_service.press_multiple
+        notify_progress = self._notify_progress
+        last_notify = 0.0
+        transpose_offset = self._transpose_offset
         
         # Use high-precision timer
-        next_time = time.perf_counter()
+        next_time = perf_counter()
         
-        i = 0
-        while i < total_events:
-            if self._stop_flag.is_set():
+        for k, (i, j) in enumerate(chord_groups):
+            if stop_set():
                 break
             
-            # Handle pause
-            while self._pause_flag.is_set() and not self._stop_flag.is_set():
-                time.sleep(0.05)
-                next_time = time.perf_counter()  # Reset timer after pause
+            # Handle pause (stop also sets the resume flag)
+            if pause_set():
+                resume_wait()
+                next_time = perf_counter()  # Reset timer after pause
             
-            if self._stop_flag.is_set():
+            if stop_set():
                 break
             
             event = events[i]
             
-            # Calculate delay with improvements
-            base_delay = event.time_delta / self._config.playback_speed
-            
-            # Dynamic tempo: slow down for dense sections
-            if self._config.dynamic_tempo and i in density_map:
-                density = density_map[i]
-                if density > 8:  # More than 8 notes/sec = dense
-                    base_delay *= 1.0 + (density - 8) * 0.03  # Slow down up to 30%
-            
-            # Velocity-based timing: softer notes get slightly longer gaps
-            if self._config.velocity_timing and event.velocity < 80:
-                velocity_factor = 1.0 + (80 - event.velocity) / 200  # Up to 40% longer
-                base_delay *= velocity_factor
-            
-            # Humanization: add random micro-timing
-            if self._config.humanize_ms > 0:
-                humanize = random.uniform(-self._config.humanize_ms, self._config.humanize_ms) / 1000.0
-                base_delay += humanize
+            # Speed is applied here so slider changes take effect immediately;
+            # humanization adds random micro-timing (zero when disabled)
+            base_delay = delays[k] / config.playback_speed + next_jitter()
             
             # Ensure minimum delay
             actual_delay = max(base_delay, min_delay) if i > 0 else 0
@@ -434,52 +618,38 @@ class AutoBardApp:
             # High-precision wait
             if actual_delay > 0:
                 next_time += actual_delay
-                sleep_time = next_time - time.perf_counter()
+                sleep_time = next_time - perf_counter()
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    sleep(sleep_time)
             
-            if self._stop_flag.is_set():
+            if stop_set():
                 break
             
-            # Collect chord notes
-            chord_events = [event]
-            j = i + 1
-            while j < total_events and events[j].time_delta <= chord_threshold:
-                chord_events.append(events[j])
-                j += 1
-            
             # Play note(s)
             try:
-                if len(chord_events) == 1:
-                    transposed_note = event.note + self._transpose_offset
-                    game_note = self._note_converter.convert(transposed_note)
-                    key_press = self._key_mapper.get_key_press(game_note)
-                    
-                    self._keyboard_service.press(
-                        key_press, 
-                        delay_ms=self._config.input_delay_ms
-                    )
+                if j - i == 1:
+                    key_press = get_key_press(convert(event.note + transpose_offset))
+                    press(key_press, delay_ms=config.input_delay_ms)
                 else:
                     # Chord with strum effect
-                    key_presses = []
-                    for ce in chord_events:
-                        transposed_note = ce.note + self._transpose_offset
-                        game_note = self._note_converter.convert(transposed_note)
-                        key_press = self._key_mapper.get_key_press(game_note)
-                        key_presses.append(key_press)
-                    
-                    self._keyboard_service.press_multiple(
+                    key_presses = [
+                        get_key_press(convert(ce.note + transpose_offset))
+                        for ce in events[i:j]
+                    ]
+                    press_multiple(
                         key_presses,
-                        delay_ms=self._config.input_delay_ms,
-                        strum_ms=self._config.chord_strum_ms
+                        delay_ms=config.input_delay_ms,
+                        strum_ms=config.chord_strum_ms
                     )
                 
-                self._notify_progress(j, total_events)
+                # Throttle observer updates; always report the final note
+                now = perf_counter()
+                if now - last_notify >= NOTIFY_INTERVAL or j >= total_events:
+                    notify_progress(j, total_events)
+                    last_notify = now
                 
             except Exception as e:
                 logger.error(f"Error playing note {event.note}: {e}")
-            
-            i = j
         
         if not self._stop_flag.is_set():
             self._set_state(PlaybackState.READY)
@@ -496,122 +666,214 @@ class AutoBardApp:
         # Calculate total duration for time display
         total_duration = song.duration / self._config.playback_speed
         
-        # Start precision timer
-        self._precision_timer.start()
+        # Precomputed per-note delays (before speed and humanization)
+        schedule = song.get_delay_schedule(
+            self._config.dynamic_tempo,
+            self._config.velocity_timing
+        )
         
-        # Start from saved position (for resume/seek)
-        i = self._start_position
-        current_time = 0.0
+        # Pre-generated humanization offsets (cycled through during playback)
+        next_jitter = self._jitter_source(song.total_notes - self._start_position)
         
-        while i < song.total_notes:
-            if self._stop_flag.is_set():
-                break
-            
-            # Handle pause
-            while self._pause_flag.is_set() and not self._stop_flag.is_set():
-                time.sleep(0.05)
-                self._precision_timer.reset()
-            
-            if self._stop_flag.is_set():
-                break
-            
-            # Track current position
-            self._current_position = i
+        # Bind hot attributes to locals once; the loop below runs per note.
+        # Config is still read per note for values the UI can change mid-song.
+        config = self._config
+        stop_set = self._stop_flag.is_set
+        pause_set = self._pause_flag.is_set
+        resume_wait = self._resume_flag.wait
+        timer = self._precision_timer
+        timer_wait = timer.wait
+        press = self._keyboard_service.press
+        press_multiple = self._keyboard_service.press_multiple
+        notify_progress = self._notify_progress
+        notify_time = self._notify_time
+        perf_counter = time.perf_counter
+        last_notify = 0.0
+        steps = song.steps
+        note_times = song.note_times
+        total_notes = song.total_notes
+        
+        # Start precision timer; it changes process-wide state (timer
+        # resolution, GIL switch interval), so always restore it
+        timer.start()
+        try:
+            # Start from saved position (for resume/seek)
+            start_position = self._start_position
+            i = start_position
             
-            # Check A-B loop
-            if (self._ab_loop_end is not None and 
-                self._ab_loop_start is not None and 
-                i >= self._ab_loop_end):
-                i = self._ab_loop_start
-                self._precision_timer.reset()
-                continue
+            while i < total_notes:
+                if stop_set():
+                    break
             
-            note = song.notes[i]
+                # Handle pause (stop also sets the resume flag)
+                if pause_set():
+                    # Don't hold the process-wide switch interval while paused
+                    timer.stop()
+                    resume_wait()
+                    timer.start()
             
-            # Calculate delay with all improvements
-            base_delay = note.time_delta / self._config.playback_speed
-            current_time += base_delay
+                if stop_set():
+                    break
             
-            # Dynamic tempo
-            if self._config.dynamic_tempo and i < len(song.density_map):
-                density = song.density_map[i]
-                if density > 8:
-                    base_delay *= 1.0 + (density - 8) * 0.03
+                # Track current position
+                self._current_position = i
             
-            # Velocity timing
-            if self._config.velocity_timing and note.velocity < 80:
-                base_delay *= 1.0 + (80 - note.velocity) / 200
+                # Check A-B loop
+                ab_start = self._ab_loop_start
+                ab_end = self._ab_loop_end
+                if ab_end is not None and ab_start is not None and i >= ab_end:
+                    i = ab_start
+                    timer.reset()
+                    continue
             
-            # Humanization
-            if self._config.humanize_ms > 0:
-                base_delay += random.uniform(-self._config.humanize_ms, self._config.humanize_ms) / 1000.0
+                # Dynamic tempo and velocity timing are baked into the schedule;
+                # speed is applied here so slider changes take effect immediately
+                speed = config.playback_speed
+                base_delay = schedule[i] / speed + next_jitter()
             
-            # Apply minimum delay
-            actual_delay = max(base_delay, min_delay) if i > self._start_position else 0
+                # Apply minimum delay
+                actual_delay = max(base_delay, min_delay) if i > start_position else 0
             
-            # Precision wait
-            if actual_delay > 0:
-                self._precision_timer.wait(actual_delay)
+                # Precision wait
+                if actual_delay > 0:
+                    timer_wait(actual_delay)
             
-            if self._stop_flag.is_set():
-                break
+                if stop_set():
+                    break
             
-            # Play using keyboard service (better game compatibility than SendInput)
-            try:
-                if note.chord_size > 1:
-                    # Chord
-                    key_presses = song.get_chord_key_presses(i)
-                    self._keyboard_service.press_multiple(
-                        key_presses,
-                        delay_ms=self._config.input_delay_ms,
-                        strum_ms=self._config.chord_strum_ms
-                    )
-                    i += note.chord_size
-                else:
-                    # Single note
-                    key_press = song.get_key_press(i)
-                    self._keyboard_service.press(key_press, delay_ms=self._config.input_delay_ms)
-                    i += 1
+                # Play using keyboard service (better game compatibility than SendInput)
+                try:
+                    presses, advance = steps[i]
+                    if isinstance(presses, KeyPress):
+                        # Single note
+                        press(presses, delay_ms=config.input_delay_ms)
+                    else:
+                        # Chord
+                        press_multiple(
+                            presses,
+                            delay_ms=config.input_delay_ms,
+                            strum_ms=config.chord_strum_ms
+                        )
+                    i += advance
                 
-                self._notify_progress(i, song.total_notes)
-                self._notify_time(current_time, total_duration)
+                    # Throttle observer updates; always report the final note
+                    now = perf_counter()
+                    if now - last_notify >= NOTIFY_INTERVAL or i >= total_notes:
+                        notify_progress(i, total_notes)
+                        notify_time(note_times[i - 1] / speed, total_duration)
+                        last_notify = now
                 
-            except Exception as e:
-                logger.error(f"Playback error: {e}")
-                i += 1
+                except Exception as e:
+                    logger.error(f"Playback error: {e}")
+                    i += 1
+            
+        finally:
+            timer.stop()
         
         # Cleanup
-        self._precision_timer.stop()
         self._start_position = 0  # Reset for next play
         
         if not self._stop_flag.is_set():
             self._set_state(PlaybackState.READY)
             logger.info("Playback finished")
     
-    def _calculate_density_map(self, events: List[NoteEvent]) -> dict:
+    def _jitter_source(self, count: int) -> Callable[[], float]:
+        """Get a callable yielding the next humanization offset in seconds.
+        
+        Cycles through the pre-generated buffer, or always yields 0.0 when
+        humanization is disabled, so playback loops need no flag check.
+        """
+        jitter = self._make_jitter(count)
+        return cycle(jitter).__next__ if jitter else repeat(0.0).__next__
+    
+    def _get_chord_groups(self, events: Sequence[NoteEvent]) -> List[Tuple[int, int]]:
+        """Get chord groups for events, reusing the cached result when possible.
+        
+        The cache holds the events it was built from, so a concurrent load
+        can never pair new events with stale groups.
+        """
+        cached_events, chord_groups = self._chord_group_cache
+        if cached_events is not events:
+            chord_groups = find_chord_groups(events)
+            self._chord_group_cache = (events, chord_groups)
+        return chord_groups
+    
+    def _group_delays(self, events: Sequence[NoteEvent],
+                      chord_groups: List[Tuple[int, int]]) -> array.array:
+        """Calculate the delay before each chord group, before speed and humanization.
+        
+        Dynamic tempo and velocity timing are applied here once per playback
+        so the playback loop does not test their flags on every note.
+        """
+        delays = array.array('d', [events[i].time_delta for i, _ in chord_groups])
+        
+        # Dynamic tempo: slow down for dense sections
+        if self._config.dynamic_tempo:
+            density_map = self._calculate_density_map(events)
+            for k, (i, _) in enumerate(chord_groups):
+                density = density_map[i]
+                if density > 8:  # More than 8 notes/sec = dense
+                    delays[k] *= 1.0 + (density - 8) * 0.03  # Slow down up to 30%
+        
+        # Velocity-based timing: softer notes get slightly longer gaps
+        if self._config.velocity_timing:
+            for k, (i, _) in enumerate(chord_groups):
+                velocity = events[i].velocity
+                if velocity < 80:
+                    delays[k] *= 1.0 + (80 - velocity) / 200  # Up to 40% longer
+        
+        return delays
+    
+    def _make_jitter(self, count: int) -> array.array:
+        """Pre-generate humanization offsets in seconds.
+        
+        Keeps random number generation out of the timing-critical playback
+        loop. The buffer is capped at JITTER_BUFFER_SIZE and reused
+        cyclically for longer songs. Returns an empty array when
+        humanization is disabled.
+        """
+        jitter = array.array('d')
+        humanize_ms = self._config.humanize_ms
+        if humanize_ms > 0 and count > 0:
+            uniform = random.uniform
+            jitter.extend(
+                uniform(-humanize_ms, humanize_ms) / 1000.0
+                for _ in range(min(count, JITTER_BUFFER_SIZE))
+            )
+        return jitter
+    
+    @staticmethod
+    def _note_on_events(events: List[NoteEvent]) -> List[NoteEvent]:
+        """Get only note-on events, without copying when there is nothing to drop.
+        
+        The MIDI and Sky services already emit note-on events only, so the
+        filtered copy is only built if a note-off actually slipped through.
+        """
+        for event in events:
+            if not event.is_note_on:
+                return [e for e in events if e.is_note_on]
+        return events
+    
+    @staticmethod
+    def _loader_range(events: Sequence[NoteEvent],
+                      song_info: Optional[SongInfo]) -> Optional[RangeStats]:
+        """Get the note range the loader recorded in its SongInfo.
+        
+        Falls back to scanning the events if the info is missing or does
+        not describe exactly these events.
+        """
+        if song_info is not None and events and song_info.note_count == len(events):
+            return RangeStats(song_info.min_note, song_info.max_note, song_info.note_count)
+        return scan_range(events)
+    
+    def _calculate_density_map(self, events: Sequence[NoteEvent]) -> array.array:
         """Calculate note density at each position for dynamic tempo.
         
-        Returns dict mapping event index to notes-per-second in surrounding 2s window.
+        Returns a float array indexed by event position holding the
+        notes-per-second in the surrounding 2s window.
         """
-        density = {}
-        window = 2.0  # 2 second window
-        
-        # Build cumulative time array
-        times = []
-        cumulative = 0.0
-        for e in events:
-            cumulative += e.time_delta
-            times.append(cumulative)
-        
-        for i, t in enumerate(times):
-            # Count notes within window centered on this note
-            start_t = t - window / 2
-            end_t = t + window / 2
-            count = sum(1 for tt in times if start_t <= tt <= end_t)
-            notes_per_sec = count / window
-            density[i] = notes_per_sec
-        
-        return density
+        times = array.array('d', accumulate(e.time_delta for e in events))
+        return note_density(times, window=2.0)
     
     def _set_state(self, state: PlaybackState) -> None:
         """Update state and notify observers."""
@@ -624,19 +886,26 @@ class AutoBardApp:
     
     def _notify_progress(self, current: int, total: int) -> None:
         """Notify progress observers."""
-        for callback in self._progress_callbacks:
-            try:
+        # Prepare the next playlist entry once the current song is 90% done
+        if self._playlist and total and current * 10 >= total * 9 and not self._config.loop_mode:
+            self._maybe_preload_next()
+        
+        # Hot path: one try block per round; a failing observer is dropped
+        try:
+            for callback in self._progress_callbacks:
                 callback(current, total)
-            except Exception as e:
-                logger.error(f"Progress callback error: {e}")
+        except Exception as e:
+            logger.error(f"Progress callback error, removing observer: {e}")
+            self._progress_callbacks = self._without(self._progress_callbacks, callback)
     
     def _notify_time(self, current: float, total: float) -> None:
         """Notify time observers."""
-        for callback in self._time_callbacks:
-            try:
+        try:
+            for callback in self._time_callbacks:
                 callback(current, total)
-            except Exception as e:
-                logger.error(f"Time callback error: {e}")
+        except Exception as e:
+            logger.error(f"Time callback error, removing observer: {e}")
+            self._time_callbacks = self._without(self._time_callbacks, callback)
     
     def _notify_countdown(self, seconds: int) -> None:
         """Notify countdown observers."""
@@ -646,21 +915,38 @@ class AutoBardApp:
             except Exception as e:
                 logger.error(f"Countdown callback error: {e}")
     
+    def _notify_load(self, path: Path, success: bool) -> None:
+        """Notify load observers."""
+        for callback in self._load_callbacks:
+            try:
+                callback(path, success)
+            except Exception as e:
+                logger.error(f"Load callback error: {e}")
+    
+    @staticmethod
+    def _without(callbacks: Tuple[Callable, ...], callback: Callable) -> Tuple[Callable, ...]:
+        """Return the callbacks with the given one removed."""
+        return tuple(cb for cb in callbacks if cb is not callback)
+    
     def on_state_change(self, callback: Callable[[PlaybackState], None]) -> None:
         """Register callback for state changes (Observer pattern)."""
-        self._state_callbacks.append(callback)
+        self._state_callbacks += (callback,)
     
     def on_progress(self, callback: Callable[[int, int], None]) -> None:
         """Register callback for playback progress updates."""
-        self._progress_callbacks.append(callback)
+        self._progress_callbacks += (callback,)
     
     def on_time_update(self, callback: Callable[[float, float], None]) -> None:
         """Register callback for time updates (current_seconds, total_seconds)."""
-        self._time_callbacks.append(callback)
+        self._time_callbacks += (callback,)
     
     def on_countdown(self, callback: Callable[[int], None]) -> None:
         """Register callback for countdown updates."""
-        self._countdown_callbacks.append(callback)
+        self._countdown_callbacks += (callback,)
+    
+    def on_load_complete(self, callback: Callable[[Path, bool], None]) -> None:
+        """Register callback for finished file loads (path, success)."""
+        self._load_callbacks += (callback,)
     
     @property
     def state(self) -> PlaybackState:
@@ -727,42 +1013,47 @@ class AutoBardApp:
         Returns:
             True if successful
         """
+        # A load finishing on the loader thread may publish a new service
+        # meanwhile; keep working with the one this reload started on
+        midi_service = self._midi_service
         try:
             if track is None:
-                self._events = self._midi_service.load_file(self._midi_service._current_file)
+                events = midi_service.load_file(midi_service._current_file)
             else:
-                self._events = self._midi_service.reload_track(track)
+                events = midi_service.reload_track(track)
             
             # Filter to note-on events only
-            self._events = [e for e in self._events if e.is_note_on]
-            original_count = len(self._events)
+            events = self._note_on_events(events)
+            original_count = len(events)
             
-            # Get note range for optimization
-            song_info = self._midi_service.get_song_info()
+            song_info = midi_service.get_song_info()
+            
+            # Single range scan, shared by the span check, window search and offset
+            note_range = scan_range(events)
             
             # Auto-optimize if enabled and song is too wide
-            if self._config.auto_optimize and song_info:
-                span = song_info.max_note - song_info.min_note
+            if self._config.auto_optimize and note_range:
+                span = note_range.max_note - note_range.min_note
                 if span > 36:
-                    window_start, _ = self._transposer.find_best_window(self._events)
-                    self._events = self._transposer.filter_to_window(self._events, window_start)
-                    logger.info(f"  Auto-optimized: kept {len(self._events)}/{original_count} notes")
+                    window_start, _ = self._transposer.find_best_window(events, note_range)
+                    events = self._transposer.filter_to_window(events, window_start)
+                    note_range = scan_range(events)
+                    logger.info(f"  Auto-optimized: kept {len(events)}/{original_count} notes")
+            
+            # Publish the finished event list in a single assignment
+            self._events = tuple(events)
             
             # Recalculate transpose based on filtered events
-            if self._events:
-                min_note = min(e.note for e in self._events)
-                max_note = max(e.note for e in self._events)
-                self._transpose_offset = self._transposer.calculate_offset((min_note, max_note))
+            if note_range:
+                self._transpose_offset = self._transposer.calculate_offset(note_range)
             else:
                 self._transpose_offset = 0
             
             # Log updated info
             if song_info:
                 logger.info(f"Reloaded track {track if track is not None else 'all'}: {original_count} original notes")
-                if self._events:
-                    new_min = min(e.note for e in self._events)
-                    new_max = max(e.note for e in self._events)
-                    logger.info(f"  Playing: {len(self._events)} notes, Range: MIDI {new_min}-{new_max}")
+                if note_range:
+                    logger.info(f"  Playing: {len(self._events)} notes, Range: MIDI {note_range.min_note}-{note_range.max_note}")
                 logger.info(f"  Transpose: {self._transpose_offset:+d} semitones")
             
             self._set_state(PlaybackState.READY)
@@ -773,15 +1064,16 @@ class AutoBardApp:
             return False
     
     def set_playback_speed(self, speed: float) -> None:
-        """Set playback speed (0.5 to 2.0)."""
-        self._config.playback_speed = max(0.5, min(2.0, speed))
+        """Set playback speed (clamped to 0.5-2.0 by AppConfig)."""
+        self._config.playback_speed = speed
     
     def set_input_delay(self, delay_ms: int) -> None:
-        """Set input delay in milliseconds."""
-        self._config.input_delay_ms = max(0, min(500, delay_ms))
+        """Set input delay in milliseconds (clamped to 0-500 by AppConfig)."""
+        self._config.input_delay_ms = delay_ms
     
     def shutdown(self) -> None:
         """Clean shutdown of the application."""
         self.stop()
         self.stop_hotkey_listener()
+        self._loader.shutdown(wait=False, cancel_futures=True)
         logger.info("Application shutdown complete")
@@ -1,13 +1,87 @@
 """Application configuration management."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
+import atexit
 import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Coalesce bursts of save() calls (slider drags, key repeats) into one write
+SAVE_DEBOUNCE_S = 0.5
+
+# Optional faster JSON backend; falls back to the standard library
+_loads: Callable[[bytes | str], Any]
+try:
+    import orjson
+    
+    def _dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+    
+    _loads = json.loads
+
+
+# The cached helpers only ever see ints; the public wrappers convert
+# first, so 5 and 5.0 can't share a cache entry with the wrong type
+@lru_cache(maxsize=256)
+def _clamp_speed_x100(speed_x100: int) -> float:
+    return max(50, min(200, speed_x100)) / 100
+
+
+@lru_cache(maxsize=512)
+def _clamp_delay_ms(delay_ms: int) -> int:
+    return max(0, min(500, delay_ms))
+
+
+def clamp_input_delay(delay_ms: float) -> int:
+    """Clamp an input delay to a whole number of ms in 0-500."""
+    return _clamp_delay_ms(int(delay_ms))
+
+
+def clamp_playback_speed(speed: float) -> float:
+    """Clamp a playback speed to 0.5-2.0 in 1% steps.
+    
+    Sliders send the same handful of values over and over, so the
+    clamped result is cached per percent.
+    """
+    return _clamp_speed_x100(round(float(speed) * 100))
+
+
+class _Clamped:
+    """Data descriptor that clamps values as they are assigned.
+    
+    Defines no __get__, so reads fall through to the instance __dict__
+    at near-plain-attribute speed; only writes pay for validation.
+    Values the clamp can't convert (e.g. a string in config.json) are
+    replaced by the field default rather than failing the whole load.
+    """
+    
+    def __init__(self, clamp: Callable[[Any], Any], default: Any):
+        self._clamp = clamp
+        self._default = default
+        self._name = ""
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+    
+    def __set__(self, instance: object, value: Any) -> None:
+        try:
+            value = self._clamp(value)
+        except (TypeError, ValueError, OverflowError):
+            logger.warning(f"Invalid {self._name} {value!r}, using {self._default}")
+            value = self._default
+        instance.__dict__[self._name] = value
+
 
 @dataclass
 class AppConfig:
@@ -48,6 +122,13 @@ class AppConfig:
     def __post_init__(self):
         if self.recent_files is None:
             self.recent_files = []
+        
+        # Debounced save state (not dataclass fields, so never serialized)
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_path: Optional[Path] = None
+        self._save_data: Optional[dict] = None
+        self._flush_at_exit = False
     
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "AppConfig":
@@ -64,8 +145,7 @@ class AppConfig:
         
         if path.exists():
             try:
-                with open(path, encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _loads(path.read_bytes())
                 logger.info(f"Loaded config from {path}")
                 return cls(**data)
             except Exception as e:
@@ -74,46 +154,84 @@ class AppConfig:
         return cls()
     
     def save(self, path: Optional[Path] = None) -> None:
-        """Save configuration to a JSON file.
+        """Schedule a save to a JSON file.
+        
+        The write happens SAVE_DEBOUNCE_S after the first call; further
+        calls before then are folded into the same write. Use save_now()
+        when the file must be on disk before continuing. A save still
+        pending when the interpreter exits is written by an atexit hook.
+        
+        The values are captured here, on the calling thread, so the timer
+        thread never serializes lists the UI is still changing.
         
         Args:
             path: Path to save to. Uses default if None.
         """
+        data = self._snapshot()
+        with self._save_lock:
+            self._save_path = path
+            self._save_data = data
+            if self._save_timer is not None:
+                return
+            timer = threading.Timer(SAVE_DEBOUNCE_S, self._flush_pending)
+            timer.daemon = True
+            self._save_timer = timer
+            if not self._flush_at_exit:
+                # The daemon timer dies with the process; don't lose the write
+                atexit.register(self._flush_pending)
+                self._flush_at_exit = True
+        timer.start()
+    
+    def save_now(self, path: Optional[Path] = None) -> None:
+        """Save configuration to a JSON file immediately.
+        
+        Cancels any pending debounced save, since this write supersedes it.
+        
+        Args:
+            path: Path to save to. Uses default if None.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._save_data = None
+            self._write(path, self._snapshot())
+    
+    def _flush_pending(self) -> None:
+        """Write a debounced save (runs on the timer thread, or at exit)."""
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+            if timer is not None:
+                timer.cancel()
+            data, self._save_data = self._save_data, None
+            if data is None:
+                return
+            try:
+                self._write(self._save_path, data)
+            except Exception as e:
+                logger.error(f"Failed to save config: {e}")
+    
+    def _snapshot(self) -> dict:
+        """Get to_dict() with lists copied, safe to serialize elsewhere."""
+        return {
+            name: list(value) if isinstance(value, list) else value
+            for name, value in self.to_dict().items()
+        }
+    
+    def _write(self, path: Optional[Path], data: dict) -> None:
+        """Serialize and write a snapshot. Caller holds _save_lock."""
         if path is None:
             path = self.get_default_path()
         
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        path.write_bytes(_dumps(data))
         
         logger.info(f"Saved config to {path}")
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
-        return {
-            "input_delay_ms": self.input_delay_ms,
-            "min_note_delay_ms": self.min_note_delay_ms,
-            "playback_speed": self.playback_speed,
-            "auto_optimize": self.auto_optimize,
-            "loop_mode": self.loop_mode,
-            "countdown_seconds": self.countdown_seconds,
-            "humanize_ms": self.humanize_ms,
-            "chord_strum_ms": self.chord_strum_ms,
-            "velocity_timing": self.velocity_timing,
-            "dynamic_tempo": self.dynamic_tempo,
-            "high_performance": self.high_performance,
-            "hotkey_start": self.hotkey_start,
-            "hotkey_stop": self.hotkey_stop,
-            "window_opacity": self.window_opacity,
-            "window_always_on_top": self.window_always_on_top,
-            "window_x": self.window_x,
-            "window_y": self.window_y,
-            "window_width": self.window_width,
-            "window_height": self.window_height,
-            "recent_files": self.recent_files,
-            "library_path": self.library_path,
-        }
+        return dict(zip(_FIELD_NAMES, _get_fields(self), strict=True))
     
     def add_recent_file(self, path: str, max_recent: int = 10) -> None:
         """Add a file to recent files list."""
@@ -122,8 +240,35 @@ class AppConfig:
         self.recent_files.insert(0, path)
         self.recent_files = self.recent_files[:max_recent]
     
+    def add_recent_files(self, paths: Iterable[str], max_recent: int = 10) -> None:
+        """Add several files to recent files list in one pass.
+        
+        Same result as calling add_recent_file() for each path in order:
+        the last path ends up first.
+        """
+        added = dict.fromkeys(reversed(list(paths)))
+        self.recent_files = [
+            *added, *(p for p in self.recent_files if p not in added)
+        ][:max_recent]
+    
     @staticmethod
     def get_default_path() -> Path:
         """Get the default config file path."""
         # Use local directory for portability
         return Path("config.json")
+
+
+# Validate these fields on every assignment (init, load, hotkeys, UI).
+# Installed after @dataclass so the field defaults stay plain values.
+for _name, _clamp in (
+    ("input_delay_ms", clamp_input_delay),
+    ("playback_speed", clamp_playback_speed),
+):
+    _descriptor = _Clamped(_clamp, AppConfig.__dataclass_fields__[_name].default)
+    _descriptor.__set_name__(AppConfig, _name)
+    setattr(AppConfig, _name, _descriptor)
+del _name, _clamp, _descriptor
+
+# Field names and a C-level getter for all of them, resolved once
+_FIELD_NAMES = tuple(f.name for f in fields(AppConfig))
+_get_fields = attrgetter(*_FIELD_NAMES)
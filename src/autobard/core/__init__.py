@@ -9,7 +9,7 @@ from .exceptions import (
 )
 from .key_mapping import KeyMapper
 from .note_converter import NoteConverter, SEMITONE_TO_NOTE, GAME_MIN_MIDI, GAME_MAX_MIDI
-from .transposer import Transposer
+from .transposer import Transposer, RangeStats, scan_range
 
 __all__ = [
     # Exceptions
@@ -22,6 +22,9 @@ __all__ = [
     "KeyMapper",
     "NoteConverter",
     "Transposer",
+    "RangeStats",
+    # Functions
+    "scan_range",
     # Constants
     "SEMITONE_TO_NOTE",
     "GAME_MIN_MIDI",
@@ -2,10 +2,70 @@
 
 import array
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from itertools import accumulate
+from typing import List, Tuple, Optional, Sequence, Union
 
 from ..models.note import KeyPress, NoteEvent
 
+# Notes closer together than this (seconds) are played as one chord
+CHORD_THRESHOLD = 0.05
+
+
+def find_chord_groups(
+    events: List[NoteEvent],
+    chord_threshold: float = CHORD_THRESHOLD
+) -> List[Tuple[int, int]]:
+    """Split events into chord groups in a single pass.
+    
+    An event joins the current group when its time_delta is within
+    chord_threshold; the first event always starts a group.
+    
+    Args:
+        events: Note events in playback order
+        chord_threshold: Max time between notes to group as chord
+        
+    Returns:
+        List of (start, end) index pairs, end exclusive
+    """
+    groups = []
+    start = 0
+    for j in range(1, len(events)):
+        if events[j].time_delta > chord_threshold:
+            groups.append((start, j))
+            start = j
+    if events:
+        groups.append((start, len(events)))
+    return groups
+
+
+def note_density(times: Sequence[float], window: float = 2.0) -> array.array:
+    """Calculate notes per second in a window centered on each note.
+    
+    Times are non-decreasing, so both window edges only move forward and
+    a single two-pointer sweep covers the whole song in O(N).
+    
+    Args:
+        times: Cumulative song time of each note
+        window: Window width in seconds
+        
+    Returns:
+        Float array of densities, one per note
+    """
+    n = len(times)
+    density = array.array('f', [0.0]) * n
+    half_window = window / 2
+    lo = 0  # First note >= t - half_window
+    hi = 0  # First note > t + half_window
+    for i, t in enumerate(times):
+        start_t = t - half_window
+        end_t = t + half_window
+        while times[lo] < start_t:
+            lo += 1
+        while hi < n and times[hi] <= end_t:
+            hi += 1
+        density[i] = (hi - lo) / window
+    return density
+
 
 @dataclass(frozen=True, slots=True)
 class CompiledNote:
@@ -25,19 +85,34 @@ class CompiledSong:
     Uses arrays for better cache performance.
     """
     
-    __slots__ = ('notes', 'total_notes', 'duration', 'density_map', 
-                 '_time_deltas', '_velocities', '_chord_sizes')
+    __slots__ = ('total_notes', 'duration', 'density_map', 
+                 '_time_deltas', '_velocities', 'chord_sizes',
+                 '_key_presses', 'steps', 'note_times',
+                 '_delay_schedule', '_schedule_key')
     
     def __init__(self):
-        self.notes: List[CompiledNote] = []
         self.total_notes: int = 0
         self.duration: float = 0.0
         self.density_map: array.array = array.array('f')
+        self.note_times: array.array = array.array('d')  # Song time at each note (1x speed)
         
-        # Parallel arrays for cache-friendly access
-        self._time_deltas: array.array = array.array('f')
+        # Parallel arrays for cache-friendly access (structure of arrays;
+        # no per-note objects are kept)
+        self._time_deltas: array.array = array.array('d')
         self._velocities: array.array = array.array('B')  # unsigned char
-        self._chord_sizes: array.array = array.array('B')
+        self.chord_sizes: array.array = array.array('B')  # >0 only on a group's first note
+        
+        # Resolved key presses, shared by the playback loop without copying
+        self._key_presses: List[KeyPress] = []
+        
+        # Playback dispatch per index: (what to press, notes to advance).
+        # Chord starts hold the chord's KeyPress tuple and its size; every
+        # other index holds its single KeyPress and 1.
+        self.steps: List[Tuple[Union[KeyPress, Tuple[KeyPress, ...]], int]] = []
+        
+        # Cached per-note delays, keyed by the timing options they were built for
+        self._delay_schedule: Optional[array.array] = None
+        self._schedule_key: Optional[Tuple[bool, bool]] = None
     
     @classmethod
     def compile(
@@ -46,7 +121,8 @@ class CompiledSong:
         transpose_offset: int,
         note_converter,
         key_mapper,
-        chord_threshold: float = 0.05
+        chord_threshold: float = CHORD_THRESHOLD,
+        chord_groups: Optional[List[Tuple[int, int]]] = None
     ) -> 'CompiledSong':
         """Compile a list of events into optimized playback data.
         
@@ -56,102 +132,163 @@ class CompiledSong:
             note_converter: NoteConverter instance
             key_mapper: KeyMapper instance
             chord_threshold: Max time between notes to group as chord
+            chord_groups: Precomputed find_chord_groups() result for events
         """
         song = cls()
         
         if not events:
             return song
         
+        # Size every buffer for the worst case up front and fill by cursor;
+        # unmappable notes are skipped, so trim the tails afterwards
+        n = len(events)
+        key_presses = song._key_presses = [None] * n
+        time_deltas = song._time_deltas = array.array('d', [0.0]) * n
+        velocities = song._velocities = array.array('B', bytes(n))
+        chord_sizes = song.chord_sizes = array.array('B', bytes(n))
+        pos = 0
+        
+        # Bind hot callables to locals; the loops below run per note
+        convert = note_converter.convert
+        get_key_press = key_mapper.get_key_press
+        
+        # Resolve every possible MIDI note once: note -> KeyPress. Equal key
+        # presses (e.g. notes clamped to the same game note) are interned so
+        # the whole song shares one object per distinct key + modifiers.
+        lut: List[Optional[KeyPress]] = [None] * 128
+        interned: dict = {}
+        for midi_note in range(128):
+            try:
+                key_press = get_key_press(convert(midi_note + transpose_offset))
+                lut[midi_note] = interned.setdefault(key_press, key_press)
+            except Exception:
+                pass  # Notes that can't be mapped are skipped below
+        
         # Pre-process: group chords and compile all notes
-        i = 0
         total_time = 0.0
         
-        while i < len(events):
-            event = events[i]
-            total_time += event.time_delta
-            
-            # Find chord group
-            chord_events = [event]
-            j = i + 1
-            while j < len(events) and events[j].time_delta <= chord_threshold:
-                chord_events.append(events[j])
-                j += 1
-            
-            # Compile each note in chord
-            for idx, ce in enumerate(chord_events):
-                try:
-                    transposed = ce.note + transpose_offset
-                    game_note = note_converter.convert(transposed)
-                    key_press = key_mapper.get_key_press(game_note)
-                    
-                    # Only first note of chord has time_delta
-                    note_time = ce.time_delta if idx == 0 else 0.0
-                    
-                    compiled = CompiledNote(
-                        key=key_press.key,
-                        modifiers=tuple(key_press.modifiers),
-                        time_delta=note_time,
-                        velocity=ce.velocity,
-                        is_chord_start=(idx == 0 and len(chord_events) > 1),
-                        chord_size=len(chord_events) if idx == 0 else 0
-                    )
-                    song.notes.append(compiled)
-                    
-                    # Parallel arrays
-                    song._time_deltas.append(note_time)
-                    song._velocities.append(min(127, ce.velocity))
-                    song._chord_sizes.append(len(chord_events) if idx == 0 else 0)
-                    
-                except Exception:
-                    pass  # Skip notes that can't be mapped
+        if chord_groups is None:
+            chord_groups = find_chord_groups(events, chord_threshold)
+        
+        for i, j in chord_groups:
+            total_time += events[i].time_delta
+            chord_len = j - i
             
-            i = j
+            # Compile each note in chord (index range, no per-chord slice)
+            for k in range(i, j):
+                ce = events[k]
+                first = k == i
+                key_press = lut[ce.note]
+                if key_press is None:
+                    continue  # Skip notes that can't be mapped
+                
+                # Only first note of chord has time_delta
+                note_time = ce.time_delta if first else 0.0
+                chord_size = chord_len if first else 0
+                
+                # Parallel arrays
+                time_deltas[pos] = note_time
+                velocities[pos] = min(127, ce.velocity)
+                chord_sizes[pos] = chord_size
+                key_presses[pos] = key_press
+                pos += 1
         
-        song.total_notes = len(song.notes)
+        if pos < n:
+            del key_presses[pos:]
+            del time_deltas[pos:], velocities[pos:], chord_sizes[pos:]
+        
+        song.total_notes = pos
         song.duration = total_time
         
-        # Pre-calculate density map
+        # Resolve what each index plays once, so the playback loop does a
+        # single lookup per note; chord tuples are handed over as-is
+        song.steps = [
+            (tuple(key_presses[k:k + size]), size) if size > 1 else (key_press, 1)
+            for k, (key_press, size) in enumerate(zip(key_presses, chord_sizes, strict=True))
+        ]
+        
+        # Pre-calculate timeline and density map
+        song._calculate_note_times()
         song._calculate_density()
         
         return song
     
+    @property
+    def notes(self) -> List[CompiledNote]:
+        """Per-note view of the compiled data, built on demand.
+        
+        Playback reads the parallel arrays directly; this is for
+        inspection and debugging only.
+        """
+        return [
+            CompiledNote(
+                key=key_press.key,
+                modifiers=key_press.modifiers,
+                time_delta=time_delta,
+                velocity=velocity,
+                is_chord_start=chord_size > 1,
+                chord_size=chord_size
+            )
+            for key_press, time_delta, velocity, chord_size in zip(
+                self._key_presses, self._time_deltas,
+                self._velocities, self.chord_sizes, strict=True
+            )
+        ]
+    
+    def _calculate_note_times(self) -> None:
+        """Pre-calculate the cumulative song time at each note."""
+        self.note_times = array.array('d', accumulate(self._time_deltas))
+    
     def _calculate_density(self, window: float = 2.0) -> None:
         """Pre-calculate note density at each position."""
-        if not self.notes:
-            return
-        
-        # Build cumulative times
-        times = []
-        cumulative = 0.0
-        for note in self.notes:
-            cumulative += note.time_delta
-            times.append(cumulative)
-        
-        # Calculate density at each position
-        half_window = window / 2
-        for t in times:
-            start_t = t - half_window
-            end_t = t + half_window
-            count = sum(1 for tt in times if start_t <= tt <= end_t)
-            density = count / window
-            self.density_map.append(density)
+        self.density_map = note_density(self.note_times, window)
+    
+    def get_delay_schedule(self, dynamic_tempo: bool, velocity_timing: bool) -> array.array:
+        """Get the precomputed delay before each note, at 1x speed.
+        
+        Applies the dynamic tempo and velocity timing multipliers once per
+        song so the playback loop only has to scale by speed, add
+        humanization and clamp to the minimum delay. The result is cached
+        until different options are requested.
+        
+        Args:
+            dynamic_tempo: Slow down dense sections
+            velocity_timing: Give softer notes slightly longer gaps
+        """
+        key = (dynamic_tempo, velocity_timing)
+        if self._delay_schedule is not None and self._schedule_key == key:
+            return self._delay_schedule
+        
+        # Work column-wise on the parallel arrays; each option is one pass
+        schedule = array.array('d', self._time_deltas)
+        
+        if dynamic_tempo:
+            for i, density in enumerate(self.density_map):
+                if density > 8:  # More than 8 notes/sec = dense
+                    schedule[i] *= 1.0 + (density - 8) * 0.03
+        
+        if velocity_timing:
+            for i, velocity in enumerate(self._velocities):
+                if velocity < 80:
+                    schedule[i] *= 1.0 + (80 - velocity) / 200
+        
+        self._delay_schedule = schedule
+        self._schedule_key = key
+        return schedule
     
     def get_key_press(self, index: int) -> KeyPress:
         """Get KeyPress for note at index."""
-        note = self.notes[index]
-        return KeyPress(key=note.key, modifiers=list(note.modifiers))
+        return self._key_presses[index]
     
-    def get_chord_key_presses(self, index: int) -> List[KeyPress]:
-        """Get all KeyPress objects for a chord starting at index."""
-        if index >= len(self.notes):
-            return []
+    def get_chord_key_presses(self, index: int) -> Sequence[KeyPress]:
+        """Get all KeyPress objects for a chord starting at index.
         
-        chord_size = self.notes[index].chord_size
-        if chord_size <= 1:
-            return [self.get_key_press(index)]
+        Returns a shared, pre-built tuple; callers must not modify it.
+        """
+        if index >= self.total_notes:
+            return ()
         
-        return [
-            self.get_key_press(index + i)
-            for i in range(chord_size)
-            if index + i < len(self.notes)
-        ]
+        presses, _ = self.steps[index]
+        if isinstance(presses, KeyPress):
+            return (presses,)
+        return presses
@@ -3,14 +3,8 @@
 This module is pure Python with no external dependencies.
 """
 
-from ..models.enums import Pitch, NoteName, Accidental
-from ..models.mapping_table import (
-    NATURAL_KEYS,
-    SHARP_KEYS,
-    FLAT_KEYS,
-    SHARPS_SUPPORTED,
-    FLATS_SUPPORTED,
-)
+from ..models.enums import NoteName, Accidental
+from ..models.mapping_table import KEY_TABLE, SHARPS_SUPPORTED, FLATS_SUPPORTED
 from ..models.note import KeyPress, GameNote
 
 
@@ -30,40 +24,11 @@ class KeyMapper:
         Returns:
             KeyPress with the appropriate key and modifiers
         """
-        if game_note.accidental == Accidental.SHARP:
-            return self._get_sharp_key(game_note.pitch, game_note.name)
-        elif game_note.accidental == Accidental.FLAT:
-            return self._get_flat_key(game_note.pitch, game_note.name)
-        return self._get_natural_key(game_note.pitch, game_note.name)
-    
-    def _get_natural_key(self, pitch: Pitch, name: NoteName) -> KeyPress:
-        """Get key press for a natural note."""
-        key = NATURAL_KEYS[pitch][name]
-        return KeyPress(key=key)
-    
-    def _get_sharp_key(self, pitch: Pitch, name: NoteName) -> KeyPress:
-        """Get key press for a sharp note.
-        
-        Falls back to natural if sharp not supported for this note.
-        Only Do#, Fa#, Sol# are supported in the game.
-        """
-        if name not in SHARPS_SUPPORTED:
-            # Fallback: unsupported sharp plays as natural
-            return self._get_natural_key(pitch, name)
-        key = SHARP_KEYS[pitch][name]
-        return KeyPress(key=key, modifiers=("shift",))
-    
-    def _get_flat_key(self, pitch: Pitch, name: NoteName) -> KeyPress:
-        """Get key press for a flat note.
-        
-        Falls back to natural if flat not supported for this note.
-        Only Mib, Tib are supported in the game.
-        """
-        if name not in FLATS_SUPPORTED:
-            # Fallback: unsupported flat plays as natural
-            return self._get_natural_key(pitch, name)
-        key = FLAT_KEYS[pitch][name]
-        return KeyPress(key=key, modifiers=("ctrl",))
+        # Unsupported accidentals already resolve to the natural key;
+        # same packing as mapping_table.key_index, inlined
+        return KEY_TABLE[
+            (game_note.pitch * 7 + game_note.name) * 3 + game_note.accidental
+        ]
     
     def is_accidental_supported(self, name: NoteName, accidental: Accidental) -> bool:
         """Check if an accidental is supported for a given note name.
@@ -15,22 +15,22 @@ from ..models.enums import Pitch, NoteName, Accidental
 from ..models.note import GameNote
 
 
-# MIDI note to scale degree mapping within an octave (0-11 semitones)
+# MIDI note to scale degree mapping within an octave, indexed by semitone (0-11)
 # C=0, C#=1, D=2, D#=3, E=4, F=5, F#=6, G=7, G#=8, A=9, A#=10, B=11
-SEMITONE_TO_NOTE: dict[int, tuple[NoteName, Accidental]] = {
-    0: (NoteName.DO, Accidental.NATURAL),    # C
-    1: (NoteName.DO, Accidental.SHARP),      # C# / Db
-    2: (NoteName.RE, Accidental.NATURAL),    # D
-    3: (NoteName.MI, Accidental.FLAT),       # D# / Eb (use Eb = Mib)
-    4: (NoteName.MI, Accidental.NATURAL),    # E
-    5: (NoteName.FA, Accidental.NATURAL),    # F
-    6: (NoteName.FA, Accidental.SHARP),      # F# / Gb
-    7: (NoteName.SOL, Accidental.NATURAL),   # G
-    8: (NoteName.SOL, Accidental.SHARP),     # G# / Ab
-    9: (NoteName.LA, Accidental.NATURAL),    # A
-    10: (NoteName.TI, Accidental.FLAT),      # A# / Bb (use Bb = Tib)
-    11: (NoteName.TI, Accidental.NATURAL),   # B
-}
+SEMITONE_TO_NOTE: tuple[tuple[NoteName, Accidental], ...] = (
+    (NoteName.DO, Accidental.NATURAL),    # C
+    (NoteName.DO, Accidental.SHARP),      # C# / Db
+    (NoteName.RE, Accidental.NATURAL),    # D
+    (NoteName.MI, Accidental.FLAT),       # D# / Eb (use Eb = Mib)
+    (NoteName.MI, Accidental.NATURAL),    # E
+    (NoteName.FA, Accidental.NATURAL),    # F
+    (NoteName.FA, Accidental.SHARP),      # F# / Gb
+    (NoteName.SOL, Accidental.NATURAL),   # G
+    (NoteName.SOL, Accidental.SHARP),     # G# / Ab
+    (NoteName.LA, Accidental.NATURAL),    # A
+    (NoteName.TI, Accidental.FLAT),       # A# / Bb (use Bb = Tib)
+    (NoteName.TI, Accidental.NATURAL),    # B
+)
 
 # Game's playable range (3 octaves)
 # We define the "base" octave as MID, centered around middle C
@@ -59,6 +59,14 @@ class NoteConverter:
                         Default is 4 (C4 = MIDI 48 = LOW Do)
         """
         self._base_octave = base_octave
+        self._min_note = self.min_midi_note
+        self._max_note = self.max_midi_note
+        
+        # GameNote is frozen, so every playable note can share one instance
+        self._table: tuple[GameNote, ...] = tuple(
+            self._compute(midi_note)
+            for midi_note in range(self._min_note, self._max_note + 1)
+        )
     
     @property
     def min_midi_note(self) -> int:
@@ -84,9 +92,12 @@ class NoteConverter:
             nearest valid octave. Use Transposer first to shift the
             entire song into range.
         """
-        # Clamp to valid range
-        clamped_note = max(self.min_midi_note, min(midi_note, self.max_midi_note))
-        
+        # Clamp to valid range and look up the precomputed note
+        min_note = self._min_note
+        return self._table[max(min_note, min(midi_note, self._max_note)) - min_note]
+    
+    def _compute(self, clamped_note: int) -> GameNote:
+        """Build the GameNote for an in-range MIDI note."""
         # Calculate octave and semitone within octave
         octave = clamped_note // 12
         semitone = clamped_note % 12
@@ -1,12 +1,19 @@
 """High-precision timing utilities for Windows."""
 
 import ctypes
+import sys
 import time
 import logging
 from contextlib import contextmanager
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# GIL switch interval while a timer is running. The spin-wait holds the GIL,
+# so with the default 5ms interval another thread (e.g. the GUI) can delay a
+# scheduled note by several milliseconds when it asks for the GIL back.
+PLAYBACK_SWITCH_INTERVAL = 0.0005
+
 # Windows multimedia timer API
 try:
     winmm = ctypes.windll.winmm
@@ -61,14 +68,26 @@ def precision_sleep(seconds: float) -> None:
     if seconds <= 0:
         return
     
-    target = time.perf_counter() + seconds
+    precision_sleep_until(time.perf_counter() + seconds)
+
+
+def precision_sleep_until(target: float) -> None:
+    """High-precision sleep until an absolute time.perf_counter() value.
+    
+    Same sleep-then-spin strategy as precision_sleep, but takes the
+    deadline directly so callers that already track one skip a clock read.
+    """
+    perf_counter = time.perf_counter  # Local for the spin loop
+    remaining = target - perf_counter()
+    if remaining <= 0:
+        return
     
     # Sleep for most of the duration (leave 1.5ms for spin)
-    if seconds > 0.002:
-        time.sleep(seconds - 0.0015)
+    if remaining > 0.002:
+        time.sleep(remaining - 0.0015)
     
     # Spin-wait for remaining time (most precise)
-    while time.perf_counter() < target:
+    while perf_counter() < target:
         pass
 
 
@@ -79,35 +98,40 @@ class PrecisionTimer:
         self._start_time = time.perf_counter()
         self._next_time = self._start_time
         self._precision_enabled = False
+        self._saved_switch_interval: Optional[float] = None
     
     def start(self) -> None:
-        """Start/reset the timer and enable high-precision mode."""
+        """Start/reset the timer and enable high-precision mode.
+        
+        Also shortens the interpreter's GIL switch interval so other
+        threads cannot hold up the timing thread for long.
+        """
         self._start_time = time.perf_counter()
         self._next_time = self._start_time
         if not self._precision_enabled:
             self._precision_enabled = enable_high_precision()
+        if self._saved_switch_interval is None:
+            self._saved_switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(PLAYBACK_SWITCH_INTERVAL)
     
     def stop(self) -> None:
         """Stop and disable high-precision mode."""
         if self._precision_enabled:
             disable_high_precision()
             self._precision_enabled = False
+        if self._saved_switch_interval is not None:
+            sys.setswitchinterval(self._saved_switch_interval)
+            self._saved_switch_interval = None
     
     def wait(self, duration: float) -> None:
         """Wait for duration seconds from last wait point."""
         self._next_time += duration
-        remaining = self._next_time - time.perf_counter()
-        
-        if remaining > 0:
-            precision_sleep(remaining)
+        precision_sleep_until(self._next_time)
     
     def wait_until(self, target_time: float) -> None:
         """Wait until absolute time (relative to start)."""
         self._next_time = self._start_time + target_time
-        remaining = self._next_time - time.perf_counter()
-        
-        if remaining > 0:
-            precision_sleep(remaining)
+        precision_sleep_until(self._next_time)
     
     def reset(self) -> None:
         """Reset timing reference point."""
@@ -6,12 +6,82 @@ transpose offset to fit songs within the game's 3-octave range.
 This module is pure Python with no external dependencies.
 """
 
-from typing import List
+from collections import Counter
+from functools import lru_cache
+from itertools import accumulate
+from operator import sub
+from typing import List, NamedTuple, Optional, Sequence
 
 from ..models.note import NoteEvent
 from .note_converter import GAME_MIN_MIDI, GAME_MAX_MIDI, GAME_RANGE
 
 
+class RangeStats(NamedTuple):
+    """Note range of a set of note-on events.
+    
+    The first two fields are min_note and max_note, so a RangeStats can be
+    passed to Transposer.calculate_offset in place of a (min, max) pair.
+    """
+    min_note: int
+    max_note: int
+    note_count: int
+
+
+def scan_range(events: Sequence[NoteEvent]) -> Optional[RangeStats]:
+    """Compute the note range of note-on events in a single pass.
+    
+    Args:
+        events: Note events to scan
+        
+    Returns:
+        RangeStats, or None if there are no note-on events
+    """
+    notes = [e.note for e in events if e.is_note_on]
+    if not notes:
+        return None
+    return RangeStats(min(notes), max(notes), len(notes))
+
+
+@lru_cache(maxsize=512)
+def _calculate_offset(song_min: int, song_max: int, game_min: int, game_max: int) -> int:
+    """Pure implementation of Transposer.calculate_offset, memoized.
+    
+    Inputs are small ints, so repeat lookups (track changes, reloads)
+    cost one dict hit.
+    """
+    song_range = song_max - song_min + 1
+    game_range = game_max - game_min + 1
+    
+    # If song already fits perfectly, no transpose needed
+    if song_min >= game_min and song_max <= game_max:
+        return 0
+    
+    # Calculate the center of each range
+    song_center = (song_min + song_max) / 2
+    game_center = (game_min + game_max) / 2
+    
+    # Raw offset to center the song
+    raw_offset = game_center - song_center
+    
+    # Round to nearest octave if the song fits, otherwise round to semitone
+    if song_range <= game_range:
+        # Song fits, prefer octave shifts for more natural sound
+        octave_offset = round(raw_offset / 12) * 12
+        
+        # Verify the octave shift works, adjust if needed
+        shifted_min = song_min + octave_offset
+        shifted_max = song_max + octave_offset
+        
+        if shifted_min >= game_min and shifted_max <= game_max:
+            return octave_offset
+        
+        # Octave shift doesn't fit, try semitone adjustment
+        return round(raw_offset)
+    else:
+        # Song is too wide, center it and accept clipping
+        return round(raw_offset)
+
+
 class Transposer:
     """Calculates and applies transpose offsets for MIDI notes.
     
@@ -30,11 +100,11 @@ class Transposer:
         self._game_max = game_max
         self._game_range = game_max - game_min + 1
     
-    def calculate_offset(self, note_range: tuple[int, int]) -> int:
+    def calculate_offset(self, note_range: Sequence[int]) -> int:
         """Calculate the optimal transpose offset for a note range.
         
         Args:
-            note_range: Tuple of (min_note, max_note) from the MIDI file
+            note_range: (min_note, max_note) from the MIDI file, or RangeStats
             
         Returns:
             Number of semitones to shift (positive = up, negative = down)
@@ -44,37 +114,7 @@ class Transposer:
         2. If the song is too wide, center it and accept some clipping
         3. Prefer shifting in octaves (12 semitones) when possible
         """
-        song_min, song_max = note_range
-        song_range = song_max - song_min + 1
-        
-        # If song already fits perfectly, no transpose needed
-        if song_min >= self._game_min and song_max <= self._game_max:
-            return 0
-        
-        # Calculate the center of each range
-        song_center = (song_min + song_max) / 2
-        game_center = (self._game_min + self._game_max) / 2
-        
-        # Raw offset to center the song
-        raw_offset = game_center - song_center
-        
-        # Round to nearest octave if the song fits, otherwise round to semitone
-        if song_range <= self._game_range:
-            # Song fits, prefer octave shifts for more natural sound
-            octave_offset = round(raw_offset / 12) * 12
-            
-            # Verify the octave shift works, adjust if needed
-            shifted_min = song_min + octave_offset
-            shifted_max = song_max + octave_offset
-            
-            if shifted_min >= self._game_min and shifted_max <= self._game_max:
-                return octave_offset
-            
-            # Octave shift doesn't fit, try semitone adjustment
-            return round(raw_offset)
-        else:
-            # Song is too wide, center it and accept clipping
-            return round(raw_offset)
+        return _calculate_offset(note_range[0], note_range[1], self._game_min, self._game_max)
     
     def apply_transpose(self, events: List[NoteEvent], offset: int) -> List[NoteEvent]:
         """Apply a transpose offset to a list of note events.
@@ -89,16 +129,21 @@ class Transposer:
         if offset == 0:
             return events
         
-        transposed = []
-        for event in events:
-            new_note = max(0, min(127, event.note + offset))
-            transposed.append(NoteEvent(
-                note=new_note,
-                velocity=event.velocity,
-                time_delta=event.time_delta,
-                is_note_on=event.is_note_on,
-            ))
-        return transposed
+        # Clamp every possible note once; each event is then one table lookup
+        shifted = [max(0, min(127, note + offset)) for note in range(128)]
+        
+        # Source events are already validated and the new note is clamped,
+        # so build the copies without re-running NoteEvent validation
+        make = NoteEvent._make
+        return [
+            make(
+                shifted[event.note],
+                event.velocity,
+                event.time_delta,
+                event.is_note_on,
+            )
+            for event in events
+        ]
     
     def get_out_of_range_count(
         self, 
@@ -117,23 +162,33 @@ class Transposer:
         below = 0
         above = 0
         
+        # Shift the bounds instead of every note; keep them in locals
+        low = self._game_min - offset
+        high = self._game_max - offset
+        
         for event in events:
             if not event.is_note_on:
                 continue
             
-            note = event.note + offset
-            if note < self._game_min:
+            note = event.note
+            if note < low:
                 below += 1
-            elif note > self._game_max:
+            elif note > high:
                 above += 1
         
         return (below, above)
     
-    def analyze_range(self, events: List[NoteEvent]) -> dict:
+    def analyze_range(
+        self,
+        events: List[NoteEvent],
+        stats: Optional[RangeStats] = None
+    ) -> dict:
         """Analyze the note range of a song.
         
         Args:
             events: List of NoteEvent objects
+            stats: Precomputed range of the events (e.g. from the loader);
+                the events are only scanned when this is None
             
         Returns:
             Dictionary with analysis results:
@@ -143,17 +198,9 @@ class Transposer:
             - fits_in_game: Whether the song fits without clipping
             - recommended_offset: Suggested transpose value
         """
-        if not events:
-            return {
-                "min_note": 0,
-                "max_note": 0,
-                "range": 0,
-                "fits_in_game": True,
-                "recommended_offset": 0,
-            }
-        
-        note_on_events = [e for e in events if e.is_note_on]
-        if not note_on_events:
+        if stats is None:
+            stats = scan_range(events)
+        if stats is None:
             return {
                 "min_note": 0,
                 "max_note": 0,
@@ -162,8 +209,7 @@ class Transposer:
                 "recommended_offset": 0,
             }
         
-        min_note = min(e.note for e in note_on_events)
-        max_note = max(e.note for e in note_on_events)
+        min_note, max_note = stats.min_note, stats.max_note
         note_range = max_note - min_note + 1
         
         offset = self.calculate_offset((min_note, max_note))
@@ -177,7 +223,11 @@ class Transposer:
             "recommended_offset": offset,
         }
     
-    def find_best_window(self, events: List[NoteEvent]) -> tuple[int, int]:
+    def find_best_window(
+        self,
+        events: List[NoteEvent],
+        stats: Optional[RangeStats] = None
+    ) -> tuple[int, int]:
         """Find the 36-semitone window that contains the most notes.
         
         This is useful for songs that span more than 3 octaves - we find
@@ -185,34 +235,48 @@ class Transposer:
         
         Args:
             events: List of NoteEvent objects
+            stats: Precomputed range of the events, if the caller has it
             
         Returns:
             Tuple of (window_start, notes_in_window)
         """
-        note_on_events = [e for e in events if e.is_note_on]
-        if not note_on_events:
+        if stats is None:
+            stats = scan_range(events)
+        if stats is None:
             return (self._game_min, 0)
         
-        notes = [e.note for e in note_on_events]
-        min_note = min(notes)
-        max_note = max(notes)
+        min_note, max_note = stats.min_note, stats.max_note
         
-        # If already fits, return the actual range
+        # If already fits, return the actual range. This is also the only
+        # case where one window can hold every note: past it, the lowest and
+        # highest notes never share a window, so no early exit on a full
+        # count is possible in the search below.
         if max_note - min_note < GAME_RANGE:
-            return (min_note, len(notes))
+            return (min_note, stats.note_count)
         
-        # Slide a 36-semitone window and count notes in each position
-        best_start = min_note
-        best_count = 0
+        # The stats already counted note-ons; if every event is one (the app
+        # filters note-offs once at load), skip re-checking each event
+        if stats.note_count == len(events):
+            notes = [e.note for e in events]
+        else:
+            notes = [e.note for e in events if e.is_note_on]
+        
+        # Histogram of MIDI notes, then prefix sums: prefix[n] = notes below n
+        histogram = [0] * 128
+        for note, count in Counter(notes).items():
+            histogram[note] = count
+        prefix = [0, *accumulate(histogram)]
         
-        for start in range(min_note, max_note - GAME_RANGE + 2):
-            end = start + GAME_RANGE - 1
-            count = sum(1 for n in notes if start <= n <= end)
-            if count > best_count:
-                best_count = count
-                best_start = start
+        # Notes in the 36-semitone window starting at each note, as one
+        # element-wise difference of the prefix sums
+        window_counts = list(map(sub, prefix[GAME_RANGE:], prefix))
         
-        return (best_start, best_count)
+        # max() keeps the first (lowest) start among equal counts
+        best_start = max(
+            range(min_note, max_note - GAME_RANGE + 2),
+            key=window_counts.__getitem__
+        )
+        return (best_start, window_counts[best_start])
     
     def filter_to_window(
         self, 
@@ -226,26 +290,26 @@ class Transposer:
             window_start: Starting MIDI note of the window
             
         Returns:
-            Filtered list with only notes in the window, timing preserved
+            Filtered list with only note-ons in the window, timing preserved
+            (time from dropped events, including note-offs, carries over
+            to the next kept note)
         """
         window_end = window_start + GAME_RANGE - 1
         filtered = []
+        append = filtered.append
+        make = NoteEvent._make  # Values come from valid events; skip validation
         accumulated_time = 0.0
         
         for event in events:
+            # Every event's delta is part of the gap, note-offs included
+            accumulated_time += event.time_delta
             if not event.is_note_on:
                 continue
             
-            accumulated_time += event.time_delta
-            
-            if window_start <= event.note <= window_end:
+            note = event.note
+            if window_start <= note <= window_end:
                 # Include this note with accumulated time since last included note
-                filtered.append(NoteEvent(
-                    note=event.note,
-                    velocity=event.velocity,
-                    time_delta=accumulated_time,
-                    is_note_on=True,
-                ))
+                append(make(note, event.velocity, accumulated_time, True))
                 accumulated_time = 0.0
         
         return filtered
@@ -0,0 +1,133 @@
+"""Shared cold-start entry point for WWM Auto-Bard.
+
+Used by both ``python -m autobard`` and the PyInstaller launcher so that
+startup work lives in a single place.
+
+Set ``AUTOBARD_STARTUP_PROFILE=1`` to log per-phase startup timings, or
+``AUTOBARD_STARTUP_PROFILE=stackprof`` to also dump a cProfile trace of the
+whole startup to ``tmp/autobard.startup.dump``. ``AUTOBARD_LOG_LEVEL`` and
+``AUTOBARD_LOG_FORMAT`` override the default logging configuration.
+"""
+
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from .config import AppConfig, APP_NAME, APP_VERSION
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "AUTOBARD_STARTUP_PROFILE"
+PROFILE_DUMP_PATH = Path("tmp") / "autobard.startup.dump"
+LOG_LEVEL_ENV = "AUTOBARD_LOG_LEVEL"
+LOG_FORMAT_ENV = "AUTOBARD_LOG_FORMAT"
+
+LOG_FORMAT = "%(name)s - %(levelname)s - %(message)s"
+LOG_FORMAT_TIMED = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _configure_logging(profiling: bool) -> None:
+    """Configure root logging from environment variables.
+    
+    Timestamps are only included when profiling startup or when
+    requested explicitly through AUTOBARD_LOG_FORMAT.
+    """
+    level = os.environ.get(LOG_LEVEL_ENV, "INFO").upper()
+    default_format = LOG_FORMAT_TIMED if profiling else LOG_FORMAT
+    logging.basicConfig(
+        level=getattr(logging, level, logging.INFO),
+        format=os.environ.get(LOG_FORMAT_ENV, default_format)
+    )
+
+
+@contextmanager
+def _phase(name: str, enabled: bool) -> Iterator[None]:
+    """Time a startup phase and log it when profiling is enabled."""
+    if not enabled:
+        yield
+        return
+
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        logger.info("phase=%s dt=%.3fms", name, (time.perf_counter() - t) * 1e3)
+
+
+def main() -> None:
+    """Main entry point for WWM Auto-Bard."""
+    if "--version" in sys.argv:
+        print(f"{APP_NAME} {APP_VERSION}")
+        return
+
+    start = time.perf_counter()
+    profile_mode = os.environ.get(PROFILE_ENV, "")
+    profiling = bool(profile_mode)
+
+    profiler = None
+    if profile_mode == "stackprof":
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    _configure_logging(profiling)
+    logger.info("%s v%s starting...", APP_NAME, APP_VERSION)
+
+    # GUI and playback stacks are heavy; import them only once we know we need them
+    with _phase("import_gui", profiling):
+        import customtkinter as ctk
+
+        from .gui.modern_window import ModernWindow
+
+    # Paint the window first; finish wiring the app inside the event loop
+    with _phase("tk_root", profiling):
+        root = ctk.CTk()
+    with _phase("window_init", profiling):
+        window = ModernWindow(root)
+
+    startup_failed = False
+
+    def _finish_startup() -> None:
+        nonlocal startup_failed
+        app = None
+        try:
+            with _phase("import_app", profiling):
+                from .app import AutoBardApp
+            with _phase("config_load", profiling):
+                config = AppConfig.load()
+            with _phase("app_init", profiling):
+                app = AutoBardApp(config)
+            with _phase("hotkey_listener", profiling):
+                app.start_hotkey_listener()
+            with _phase("window_attach", profiling):
+                window.attach_app(app)
+        except Exception as e:
+            # Tk would only print this to stderr and leave the window on
+            # its loading placeholder; report it and exit instead
+            logger.exception("Startup failed")
+            startup_failed = True
+            if app is not None:
+                app.shutdown()
+            from tkinter import messagebox
+            messagebox.showerror(APP_NAME, f"Startup failed:\n{e}")
+            root.destroy()
+            return
+
+        if profiling:
+            logger.info("phase=total dt=%.3fms", (time.perf_counter() - start) * 1e3)
+        if profiler is not None:
+            profiler.disable()
+            PROFILE_DUMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(PROFILE_DUMP_PATH))
+            logger.info("Startup profile written to %s", PROFILE_DUMP_PATH)
+
+        logger.info("Application ready")
+
+    root.after(0, _finish_startup)
+    window.run()
+    if startup_failed:
+        sys.exit(1)
@@ -3,7 +3,7 @@
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ..models import PlaybackState
 from ..config import APP_NAME
@@ -15,6 +15,9 @@ from .widgets.track_selector import TrackSelector
 if TYPE_CHECKING:
     from ..app import AutoBardApp
 
+# Coalesce slider drags: only the last value in this window reaches the app
+SLIDER_DEBOUNCE_MS = 50
+
 
 class MainWindow:
     """Main application window - compact overlay design.
@@ -32,14 +35,16 @@ class MainWindow:
         """
         self._root = root
         self._app = app
+        self._delay_pending_id: Optional[str] = None
         
         self._setup_window()
         self._create_widgets()
         self._bind_events()
         
-        # Register as observer
+        # Register as observer. No progress observer: this window has no
+        # progress display, and an empty callback would still be called
+        # for every notification during playback.
         app.on_state_change(self._on_state_change)
-        app.on_progress(self._on_progress)
     
     def _setup_window(self) -> None:
         """Configure the window appearance."""
@@ -129,9 +134,11 @@ class MainWindow:
         )
         self._delay_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
+        # Label text lives in a variable so drags only touch the variable
+        self._delay_text = tk.StringVar(value=f"{self._app.config.input_delay_ms}ms")
         self._delay_label = tk.Label(
             delay_inner,
-            text=f"{self._app.config.input_delay_ms}ms",
+            textvariable=self._delay_text,
             font=("Segoe UI", 9),
             fg="#ffffff",
             bg="#2b2b2b",
@@ -183,18 +190,24 @@ class MainWindow:
     def _on_delay_change(self, value: str) -> None:
         """Handle delay slider change."""
         delay = int(float(value))
+        self._delay_text.set(f"{delay}ms")
+        
+        # Label updates immediately; the app write waits for the drag to settle
+        if self._delay_pending_id is not None:
+            self._root.after_cancel(self._delay_pending_id)
+        self._delay_pending_id = self._root.after(
+            SLIDER_DEBOUNCE_MS, self._apply_delay, delay
+        )
+    
+    def _apply_delay(self, delay: int) -> None:
+        """Push a settled delay slider value to the app."""
+        self._delay_pending_id = None
         self._app.set_input_delay(delay)
-        self._delay_label.config(text=f"{delay}ms")
     
     def _on_state_change(self, state: PlaybackState) -> None:
         """Handle playback state changes (Observer callback)."""
         self._status.set_state(state)
     
-    def _on_progress(self, current: int, total: int) -> None:
-        """Handle progress updates (Observer callback)."""
-        # Could update a progress bar here
-        pass
-    
     def run(self) -> None:
         """Start the main event loop."""
         self._root.mainloop()
@@ -2,9 +2,12 @@
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
+from functools import lru_cache, partial, wraps
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 import logging
+import os
+import sys
 
 from ..models import PlaybackState
 from ..config import APP_NAME, APP_VERSION
@@ -18,14 +21,130 @@ logger = logging.getLogger(__name__)
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Palette
+COLOR_MUTED = "#888888"
+COLOR_HINT = "#666666"
+COLOR_ACCENT = "#3b8ed0"
+COLOR_PLAYING = "#4ecca3"
+COLOR_WARNING = "#f0ad4e"
+COLOR_SURFACE = "#2b2b2b"
+COLOR_SURFACE_HOVER = "#3b3b3b"
+
+# Status text, status colour and play button icon per playback state
+_DEFAULT_STATE = ("● Ready", COLOR_MUTED, "▶")
+_STATE_MAP: dict[PlaybackState, tuple[str, str, str]] = {
+    PlaybackState.READY: _DEFAULT_STATE,
+    PlaybackState.PLAYING: ("● Playing", COLOR_PLAYING, "⏸"),
+    PlaybackState.PAUSED: ("● Paused", COLOR_WARNING, "▶"),
+    PlaybackState.STOPPED: ("● Stopped", COLOR_MUTED, "▶"),
+}
+
+# Coalesce slider drags: only the last value in this window reaches the app
+SLIDER_DEBOUNCE_MS = 50
+
+# Progress/time labels repaint at most this often during playback
+UI_REFRESH_MS = 50
+
+
+def _marshal(method: Callable) -> Callable:
+    """Run an observer method on the Tk event loop.
+    
+    App observers fire on the playback thread; Tk widgets must only be
+    touched from the thread running mainloop.
+    """
+    @wraps(method)
+    def wrapper(self, *args) -> None:
+        self._root.after(0, method, self, *args)
+    return wrapper
+
+
+def _resolve_icon_path() -> Optional[str]:
+    """Find the window icon (works for both dev and exe)."""
+    if getattr(sys, 'frozen', False):
+        # Running as exe
+        base = Path(sys._MEIPASS)
+    else:
+        # Running as script
+        base = Path(__file__).parent.parent.parent.parent
+    
+    icon_path = base / 'resources' / 'icon.ico'
+    return str(icon_path) if icon_path.exists() else None
+
+
+# Resolved once per process, not per window
+_ICON_PATH = _resolve_icon_path()
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Get a shared font; each distinct size/weight is created once."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+@lru_cache(maxsize=1024)
+def _fmt_time_int(total_seconds: int) -> str:
+    """Format whole seconds as m:ss; songs rarely outlast the cache."""
+    m, s = divmod(total_seconds, 60)
+    return f"{m}:{s:02d}"
+
 
 class ModernWindow:
     """Modern UI window using CustomTkinter."""
     
-    def __init__(self, root: ctk.CTk, app: "AutoBardApp"):
+    # Assigned by attach_app(); nothing reads it before the full UI is built
+    _app: "AutoBardApp"
+    
+    def __init__(self, root: ctk.CTk, app: Optional["AutoBardApp"] = None):
+        """Create the window.
+        
+        Args:
+            root: The CustomTkinter root window
+            app: The application controller. If None, a loading placeholder
+                 is shown until attach_app() is called.
+        """
         self._root = root
-        self._app = app
         self._current_file: Optional[Path] = None
+        self._loading_label: Optional[ctk.CTkLabel] = None
+        self._speed_after_id: Optional[str] = None
+        self._pending_speed = 1.0
+        # Set while a play/pause key is held down; OS auto-repeat sends
+        # further KeyPress events but only the first one toggles
+        self._toggle_held = False
+        
+        # Latest playback position, applied by _flush_ui at UI_REFRESH_MS
+        self._pending_progress: Optional[float] = None
+        self._pending_time: Optional[float] = None
+        self._ui_refresh_scheduled = False
+        
+        # Position repaints are skipped while another tab hides the widgets
+        self._active_tab = "Player"
+        
+        # Last values written to the position widgets; flushes only touch
+        # a widget when its displayed value actually changes
+        self._ui_state = {"progress": 0.0, "time": "0:00"}
+        
+        self._root.title(APP_NAME)
+        self._set_icon()
+        
+        if app is None:
+            self._show_loading()
+        else:
+            self.attach_app(app)
+    
+    def _show_loading(self) -> None:
+        """Show a placeholder while the application finishes starting up."""
+        self._loading_label = ctk.CTkLabel(self._root, text="Loading...",
+                                          font=_font(14),
+                                          text_color=COLOR_MUTED)
+        self._loading_label.pack(expand=True, padx=40, pady=40)
+    
+    def attach_app(self, app: "AutoBardApp") -> None:
+        """Attach the application controller and build the full UI."""
+        self._app = app
+        
+        if self._loading_label is not None:
+            self._loading_label.destroy()
+            self._loading_label = None
         
         self._setup_window()
         self._create_ui()
@@ -36,13 +155,9 @@ class ModernWindow:
         app.on_progress(self._on_progress)
         app.on_time_update(self._on_time_update)
         app.on_countdown(self._on_countdown)
+        app.on_load_complete(self._on_load_complete)
     
     def _setup_window(self) -> None:
-        self._root.title(APP_NAME)
-        
-        # Set window icon
-        self._set_icon()
-        
         cfg = self._app.config
         w, h = cfg.window_width, cfg.window_height
         
@@ -62,28 +177,16 @@ class ModernWindow:
     
     def _set_icon(self) -> None:
         """Set the window and taskbar icon."""
-        import sys
-        from pathlib import Path
-        
-        # Find icon path (works for both dev and exe)
-        if getattr(sys, 'frozen', False):
-            # Running as exe
-            base = Path(sys._MEIPASS)
-        else:
-            # Running as script
-            base = Path(__file__).parent.parent.parent.parent
-        
-        icon_path = base / 'resources' / 'icon.ico'
-        
-        if icon_path.exists():
+        if _ICON_PATH is not None:
             try:
-                self._root.iconbitmap(str(icon_path))
+                self._root.iconbitmap(_ICON_PATH)
             except Exception as e:
                 logger.warning(f"Could not set icon: {e}")
     
     def _create_ui(self) -> None:
         # Main container with tabs
-        self._tabview = ctk.CTkTabview(self._root, corner_radius=10)
+        self._tabview = ctk.CTkTabview(self._root, corner_radius=10,
+                                      command=self._on_tab_change)
         self._tabview.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Create tabs
@@ -98,133 +201,141 @@ class ModernWindow:
     def _create_player_tab(self) -> None:
         tab = self._tabview.tab("Player")
         
+        # One grid on the tab instead of a transparent frame per row.
+        # Columns: narrow caption | stretching widget | narrow value
+        tab.grid_columnconfigure(1, weight=1)
+        
         # === NOW PLAYING CARD ===
         card = ctk.CTkFrame(tab, corner_radius=15)
-        card.pack(fill='x', pady=(0, 15))
+        card.grid(row=0, column=0, columnspan=3, sticky='ew', pady=(0, 15))
+        card.grid_columnconfigure(0, weight=1)
         
         # Status row
-        status_frame = ctk.CTkFrame(card, fg_color="transparent")
-        status_frame.pack(fill='x', padx=20, pady=(15, 5))
+        self._status_label = ctk.CTkLabel(card, text="● Ready",
+                                         font=_font(13, "bold"),
+                                         text_color=COLOR_MUTED)
+        self._status_label.grid(row=0, column=0, sticky='w', padx=(20, 0), pady=(15, 5))
         
-        self._status_label = ctk.CTkLabel(status_frame, text="● Ready",
-                                         font=ctk.CTkFont(size=13, weight="bold"),
-                                         text_color="#888888")
-        self._status_label.pack(side='left')
-        
-        self._loop_label = ctk.CTkLabel(status_frame, text="",
-                                       font=ctk.CTkFont(size=12),
-                                       text_color="#f0ad4e")
-        self._loop_label.pack(side='right')
+        self._loop_label = ctk.CTkLabel(card, text="",
+                                       font=_font(12),
+                                       text_color=COLOR_WARNING)
+        self._loop_label.grid(row=0, column=1, sticky='e', padx=(0, 20), pady=(15, 5))
         
         # Song title
         self._song_title = ctk.CTkLabel(card, text="No song loaded",
-                                       font=ctk.CTkFont(size=18, weight="bold"),
+                                       font=_font(18, "bold"),
                                        wraplength=350)
-        self._song_title.pack(padx=20, pady=(5, 0))
+        self._song_title.grid(row=1, column=0, columnspan=2, padx=20, pady=(5, 0))
         
         # Song info
         self._song_info = ctk.CTkLabel(card, text="Open a MIDI or Sky sheet file",
-                                      font=ctk.CTkFont(size=12),
-                                      text_color="#888888")
-        self._song_info.pack(padx=20, pady=(0, 15))
+                                      font=_font(12),
+                                      text_color=COLOR_MUTED)
+        self._song_info.grid(row=2, column=0, columnspan=2, padx=20, pady=(0, 15))
         
-        # Countdown overlay
-        self._countdown_label = ctk.CTkLabel(card, text="",
-                                            font=ctk.CTkFont(size=64, weight="bold"),
-                                            text_color="#3b8ed0")
+        # Countdown overlay; always gridded with a fixed height so the
+        # per-second ticks only change text and never trigger a relayout
+        self._countdown_label = ctk.CTkLabel(card, text="", height=80,
+                                            font=_font(64, "bold"),
+                                            text_color=COLOR_ACCENT)
+        self._countdown_label.grid(row=3, column=0, columnspan=2, pady=(0, 10))
         
         # === PROGRESS BAR ===
-        progress_frame = ctk.CTkFrame(tab, fg_color="transparent")
-        progress_frame.pack(fill='x', pady=(0, 10))
-        
-        self._time_current = ctk.CTkLabel(progress_frame, text="0:00",
-                                         font=ctk.CTkFont(size=11),
-                                         text_color="#888888", width=45)
-        self._time_current.pack(side='left')
+        self._time_current = ctk.CTkLabel(tab, text="0:00",
+                                         font=_font(11),
+                                         text_color=COLOR_MUTED, width=45)
+        self._time_current.grid(row=1, column=0, sticky='w', pady=(0, 10))
         
-        self._progress_bar = ctk.CTkProgressBar(progress_frame, height=8,
+        self._progress_bar = ctk.CTkProgressBar(tab, height=8,
                                                corner_radius=4)
-        self._progress_bar.pack(side='left', fill='x', expand=True, padx=10)
+        self._progress_bar.grid(row=1, column=1, sticky='ew', padx=10, pady=(0, 10))
         self._progress_bar.set(0)
         self._progress_bar.bind('<Button-1>', self._on_progress_click)
         
-        self._time_total = ctk.CTkLabel(progress_frame, text="0:00",
-                                       font=ctk.CTkFont(size=11),
-                                       text_color="#888888", width=45)
-        self._time_total.pack(side='right')
+        self._time_total = ctk.CTkLabel(tab, text="0:00",
+                                       font=_font(11),
+                                       text_color=COLOR_MUTED, width=45)
+        self._time_total.grid(row=1, column=2, sticky='e', pady=(0, 10))
         
         # === MAIN CONTROLS ===
         # Big play button centered
         self._play_btn = ctk.CTkButton(tab, text="▶", width=90, height=90,
-                                      font=ctk.CTkFont(size=36),
+                                      font=_font(36),
                                       corner_radius=45,
                                       command=self._toggle_play)
-        self._play_btn.pack(pady=(15, 10))
+        self._play_btn.grid(row=2, column=0, columnspan=3, pady=(15, 10))
         
-        # Secondary controls row below
+        # Secondary controls row below; kept in its own frame so the
+        # buttons center as a group independent of the tab's columns
         controls = ctk.CTkFrame(tab, fg_color="transparent")
-        controls.pack()
+        controls.grid(row=3, column=0, columnspan=3)
         
         self._restart_btn = ctk.CTkButton(controls, text="⏮ Restart", width=90, height=36,
-                                         font=ctk.CTkFont(size=12),
-                                         fg_color="#2b2b2b", hover_color="#3b3b3b",
+                                         font=_font(12),
+                                         fg_color=COLOR_SURFACE, hover_color=COLOR_SURFACE_HOVER,
                                          command=self._restart)
         self._restart_btn.grid(row=0, column=0, padx=4)
         
         self._stop_btn = ctk.CTkButton(controls, text="⏹ Stop", width=90, height=36,
-                                      font=ctk.CTkFont(size=12),
-                                      fg_color="#2b2b2b", hover_color="#3b3b3b",
+                                      font=_font(12),
+                                      fg_color=COLOR_SURFACE, hover_color=COLOR_SURFACE_HOVER,
                                       command=self._app.stop)
         self._stop_btn.grid(row=0, column=1, padx=4)
         
         self._loop_btn = ctk.CTkButton(controls, text="🔁 Loop", width=90, height=36,
-                                      font=ctk.CTkFont(size=12),
-                                      fg_color="#2b2b2b", hover_color="#3b3b3b",
+                                      font=_font(12),
+                                      fg_color=COLOR_SURFACE, hover_color=COLOR_SURFACE_HOVER,
                                       command=self._toggle_loop)
         self._loop_btn.grid(row=0, column=2, padx=4)
         
         # === SPEED SLIDER ===
-        speed_frame = ctk.CTkFrame(tab, fg_color="transparent")
-        speed_frame.pack(fill='x', pady=10)
+        ctk.CTkLabel(tab, text="Speed", font=_font(12),
+                    text_color=COLOR_MUTED).grid(row=4, column=0, sticky='w', pady=10)
         
-        ctk.CTkLabel(speed_frame, text="Speed", font=ctk.CTkFont(size=12),
-                    text_color="#888888").pack(side='left')
-        
-        self._speed_label = ctk.CTkLabel(speed_frame, text="100%",
-                                        font=ctk.CTkFont(size=12, weight="bold"),
-                                        width=50)
-        self._speed_label.pack(side='right')
-        
-        self._speed_slider = ctk.CTkSlider(speed_frame, from_=25, to=200,
+        self._speed_slider = ctk.CTkSlider(tab, from_=25, to=200,
                                           number_of_steps=35,
                                           command=self._on_speed_change)
         self._speed_slider.set(100)
-        self._speed_slider.pack(side='left', fill='x', expand=True, padx=15)
+        self._speed_slider.grid(row=4, column=1, sticky='ew', padx=15, pady=10)
         
-        # === TRACK SELECTOR ===
-        self._track_frame = ctk.CTkFrame(tab, fg_color="transparent")
+        self._speed_label = ctk.CTkLabel(tab, text="100%",
+                                        font=_font(12, "bold"),
+                                        width=50)
+        self._speed_label.grid(row=4, column=2, sticky='e', pady=10)
         
-        ctk.CTkLabel(self._track_frame, text="Track:",
-                    font=ctk.CTkFont(size=12)).pack(side='left')
+        # === TRACK SELECTOR ===
+        track_caption = ctk.CTkLabel(tab, text="Track:", font=_font(12))
+        track_caption.grid(row=5, column=0, sticky='w', pady=10)
         
         self._track_var = ctk.StringVar(value="All tracks")
-        self._track_menu = ctk.CTkOptionMenu(self._track_frame,
+        self._track_values = ["All tracks"]
+        self._track_label_to_index: dict[str, int] = {}
+        self._track_menu = ctk.CTkOptionMenu(tab,
                                             variable=self._track_var,
-                                            values=["All tracks"],
+                                            values=self._track_values,
                                             command=self._on_track_change,
                                             width=250)
-        self._track_menu.pack(side='left', padx=(10, 0), fill='x', expand=True)
+        self._track_menu.grid(row=5, column=1, columnspan=2, sticky='ew',
+                              padx=(10, 0), pady=10)
+        
+        # Hidden until a multi-track file loads; grid_remove keeps the
+        # placement so showing the row again is a bare grid() call
+        self._track_row = (track_caption, self._track_menu)
+        for widget in self._track_row:
+            widget.grid_remove()
         
         # === OPEN FILE BUTTON ===
         self._open_btn = ctk.CTkButton(tab, text="📁  Open File", height=45,
-                                      font=ctk.CTkFont(size=14),
+                                      font=_font(14),
                                       command=self._open_file)
-        self._open_btn.pack(fill='x', pady=(15, 0))
+        self._open_btn.grid(row=6, column=0, columnspan=3, sticky='ew', pady=(15, 0))
         
         # === SHORTCUTS HINT ===
+        # The stretching row above it keeps the hint at the bottom of the tab
+        tab.grid_rowconfigure(7, weight=1)
         ctk.CTkLabel(tab, text="F10: Play/Pause  •  F12: Stop  •  Home: Restart",
-                    font=ctk.CTkFont(size=11), text_color="#666666"
-                    ).pack(side='bottom', pady=(10, 0))
+                    font=_font(11), text_color=COLOR_HINT
+                    ).grid(row=7, column=0, columnspan=3, sticky='s', pady=(10, 0))
     
     def _create_library_tab(self) -> None:
         tab = self._tabview.tab("Library")
@@ -234,23 +345,26 @@ class ModernWindow:
         header.pack(fill='x', pady=(0, 10))
         
         ctk.CTkLabel(header, text="Recent Files",
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(side='left')
+                    font=_font(16, "bold")).pack(side='left')
         
         ctk.CTkButton(header, text="Clear", width=60, height=28,
-                     fg_color="transparent", hover_color="#3b3b3b",
-                     text_color="#888888", command=self._clear_recent
+                     fg_color="transparent", hover_color=COLOR_SURFACE_HOVER,
+                     text_color=COLOR_MUTED, command=self._clear_recent
                      ).pack(side='right')
         
         # File list with scrolling
         self._file_scroll = ctk.CTkScrollableFrame(tab, corner_radius=10)
         self._file_scroll.pack(fill='both', expand=True)
         
+        # Buttons are pooled and reconfigured on refresh, never rebuilt
         self._file_buttons: list[ctk.CTkButton] = []
+        self._empty_label = ctk.CTkLabel(self._file_scroll, text="No recent files",
+                                        text_color=COLOR_HINT)
         self._update_library()
         
         # Add files button
         ctk.CTkButton(tab, text="+ Add Files", height=40,
-                     fg_color="#2b2b2b", hover_color="#3b3b3b",
+                     fg_color=COLOR_SURFACE, hover_color=COLOR_SURFACE_HOVER,
                      command=self._add_files).pack(fill='x', pady=(10, 0))
     
     def _create_settings_tab(self) -> None:
@@ -268,7 +382,7 @@ class ModernWindow:
         countdown_frame.pack(fill='x', pady=5)
         
         ctk.CTkLabel(countdown_frame, text="Countdown (seconds)",
-                    font=ctk.CTkFont(size=13)).pack(side='left')
+                    font=_font(13)).pack(side='left')
         
         self._countdown_var = ctk.StringVar(value=str(self._app.config.countdown_seconds))
         countdown_menu = ctk.CTkOptionMenu(countdown_frame, variable=self._countdown_var,
@@ -281,7 +395,7 @@ class ModernWindow:
         delay_frame.pack(fill='x', pady=5)
         
         ctk.CTkLabel(delay_frame, text="Min note delay (ms)",
-                    font=ctk.CTkFont(size=13)).pack(side='left')
+                    font=_font(13)).pack(side='left')
         
         self._delay_var = ctk.StringVar(value=str(self._app.config.min_note_delay_ms))
         delay_entry = ctk.CTkEntry(delay_frame, textvariable=self._delay_var,
@@ -294,7 +408,7 @@ class ModernWindow:
         humanize_frame.pack(fill='x', pady=5)
         
         ctk.CTkLabel(humanize_frame, text="Humanize timing (ms)",
-                    font=ctk.CTkFont(size=13)).pack(side='left')
+                    font=_font(13)).pack(side='left')
         
         self._humanize_var = ctk.StringVar(value=str(self._app.config.humanize_ms))
         humanize_entry = ctk.CTkEntry(humanize_frame, textvariable=self._humanize_var,
@@ -307,7 +421,7 @@ class ModernWindow:
         strum_frame.pack(fill='x', pady=5)
         
         ctk.CTkLabel(strum_frame, text="Chord strum (ms)",
-                    font=ctk.CTkFont(size=13)).pack(side='left')
+                    font=_font(13)).pack(side='left')
         
         self._strum_var = ctk.StringVar(value=str(self._app.config.chord_strum_ms))
         strum_entry = ctk.CTkEntry(strum_frame, textvariable=self._strum_var,
@@ -323,7 +437,7 @@ class ModernWindow:
         top_frame.pack(fill='x', pady=5)
         
         ctk.CTkLabel(top_frame, text="Always on top",
-                    font=ctk.CTkFont(size=13)).pack(side='left')
+                    font=_font(13)).pack(side='left')
         
         self._topmost_var = ctk.BooleanVar(value=self._app.config.window_always_on_top)
         topmost_switch = ctk.CTkSwitch(top_frame, text="",
@@ -340,8 +454,8 @@ class ModernWindow:
                                        "Space - Play/Pause (app focused)\n"
                                        "Home - Restart song\n"
                                        "Escape - Stop",
-                                  font=ctk.CTkFont(size=12),
-                                  text_color="#888888",
+                                  font=_font(12),
+                                  text_color=COLOR_MUTED,
                                   justify='left')
         hotkey_info.pack(anchor='w', pady=5)
         
@@ -349,9 +463,9 @@ class ModernWindow:
         self._create_section(scroll, "About")
         
         ctk.CTkLabel(scroll, text=f"{APP_NAME} v{APP_VERSION}",
-                    font=ctk.CTkFont(size=13, weight="bold")).pack(anchor='w')
+                    font=_font(13, "bold")).pack(anchor='w')
         ctk.CTkLabel(scroll, text="MIDI & Sky sheet to keyboard macro player\nfor Where Winds Meet",
-                    font=ctk.CTkFont(size=12), text_color="#888888",
+                    font=_font(12), text_color=COLOR_MUTED,
                     justify='left').pack(anchor='w', pady=(2, 0))
     
     def _create_section(self, parent, title: str) -> None:
@@ -360,19 +474,38 @@ class ModernWindow:
         frame.pack(fill='x', pady=(20, 10))
         
         ctk.CTkLabel(frame, text=title,
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    text_color="#3b8ed0").pack(side='left')
+                    font=_font(14, "bold"),
+                    text_color=COLOR_ACCENT).pack(side='left')
         
         # Separator line
-        sep = ctk.CTkFrame(frame, height=1, fg_color="#3b3b3b")
+        sep = ctk.CTkFrame(frame, height=1, fg_color=COLOR_SURFACE_HOVER)
         sep.pack(side='left', fill='x', expand=True, padx=(15, 0))
     
     def _bind_keys(self) -> None:
-        self._root.bind('<F10>', lambda e: self._toggle_play())
-        self._root.bind('<F12>', lambda e: self._app.stop())
-        self._root.bind('<Escape>', lambda e: self._app.stop())
-        self._root.bind('<space>', lambda e: self._toggle_play())
-        self._root.bind('<Home>', lambda e: self._restart())
+        self._root.bind('<F10>', self._on_toggle_key)
+        self._root.bind('<F12>', self._on_stop_key)
+        self._root.bind('<Escape>', self._on_stop_key)
+        self._root.bind('<space>', self._on_toggle_key)
+        self._root.bind('<KeyRelease-F10>', self._on_toggle_release)
+        self._root.bind('<KeyRelease-space>', self._on_toggle_release)
+        # A release that happens while unfocused never reaches us
+        self._root.bind('<FocusOut>', self._on_toggle_release, add='+')
+        self._root.bind('<Home>', self._on_restart_key)
+    
+    def _on_toggle_key(self, event=None) -> None:
+        if self._toggle_held:
+            return
+        self._toggle_held = True
+        self._toggle_play()
+    
+    def _on_toggle_release(self, event=None) -> None:
+        self._toggle_held = False
+    
+    def _on_stop_key(self, event=None) -> None:
+        self._app.stop()
+    
+    def _on_restart_key(self, event=None) -> None:
+        self._restart()
     
     # === PLAYER ACTIONS ===
     
@@ -389,40 +522,57 @@ class ModernWindow:
             self._load_file(Path(path))
     
     def _load_file(self, path: Path) -> None:
-        if self._app.load_midi(path):
-            self._current_file = path
-            self._app.config.add_recent_file(str(path))
-            self._app.config.save()
-            
-            # Update UI
-            name = path.stem
-            if len(name) > 35:
-                name = name[:32] + "..."
-            self._song_title.configure(text=name)
-            
-            notes = self._app.total_notes
-            duration = self._app.song_duration
-            self._song_info.configure(text=f"{notes} notes  •  {self._fmt_time(duration)}")
-            self._time_total.configure(text=self._fmt_time(duration))
-            self._time_current.configure(text="0:00")
-            self._progress_bar.set(0)
-            
-            self._status_label.configure(text="● Ready", text_color="#888888")
-            
-            # Track selector
-            tracks = self._app.get_track_info()
-            if tracks and len(tracks) > 1:
-                values = ["All tracks"]
-                for t in tracks:
-                    if t['note_count'] > 0:
-                        values.append(f"Track {t['index']}: {t['name']} ({t['note_count']} notes)")
+        self._status_label.configure(text="● Loading...", text_color=COLOR_MUTED)
+        self._app.load_midi_async(path)
+    
+    def _on_load_complete(self, path: Path, success: bool) -> None:
+        # Called from the loader thread; hand off to the Tk event loop
+        self._root.after(0, self._apply_loaded_file, path, success)
+    
+    def _apply_loaded_file(self, path: Path, success: bool) -> None:
+        if not success:
+            self._status_label.configure(text="● Ready", text_color=COLOR_MUTED)
+            return
+        
+        self._current_file = path
+        self._app.config.add_recent_file(str(path))
+        self._app.config.save()
+        
+        # Update UI
+        name = path.stem
+        if len(name) > 35:
+            name = name[:32] + "..."
+        self._song_title.configure(text=name)
+        
+        notes = self._app.total_notes
+        duration = self._app.song_duration
+        self._song_info.configure(text=f"{notes} notes  •  {self._fmt_time(duration)}")
+        self._time_total.configure(text=self._fmt_time(duration))
+        self._reset_progress()
+        
+        self._status_label.configure(text="● Ready", text_color=COLOR_MUTED)
+        
+        # Track selector
+        tracks = self._app.get_track_info()
+        if tracks and len(tracks) > 1:
+            label_to_index = {
+                f"Track {t['index']}: {t['name']} ({t['note_count']} notes)": t['index']
+                for t in tracks if t['note_count'] > 0
+            }
+            values = ["All tracks", *label_to_index]
+            # Reloading the same file gives the same menu; skip the rebuild
+            if values != self._track_values:
+                self._track_values = values
+                self._track_label_to_index = label_to_index
                 self._track_menu.configure(values=values)
-                self._track_var.set("All tracks")
-                self._track_frame.pack(fill='x', pady=10, before=self._open_btn)
-            else:
-                self._track_frame.pack_forget()
-            
-            self._update_library()
+            self._track_var.set("All tracks")
+            for widget in self._track_row:
+                widget.grid()
+        else:
+            for widget in self._track_row:
+                widget.grid_remove()
+        
+        self._update_library()
     
     def _toggle_play(self) -> None:
         if self._app.state == PlaybackState.PLAYING:
@@ -433,40 +583,40 @@ class ModernWindow:
     def _restart(self) -> None:
         self._app.stop()
         self._app.seek(0)
-        self._progress_bar.set(0)
-        self._time_current.configure(text="0:00")
+        self._reset_progress()
     
     def _toggle_loop(self) -> None:
         enabled = self._app.toggle_loop()
         if enabled:
-            self._loop_btn.configure(fg_color="#3b8ed0")
+            self._loop_btn.configure(fg_color=COLOR_ACCENT)
             self._loop_label.configure(text="🔁 Loop ON")
         else:
-            self._loop_btn.configure(fg_color="#2b2b2b")
+            self._loop_btn.configure(fg_color=COLOR_SURFACE)
             self._loop_label.configure(text="")
     
     def _on_speed_change(self, value: float) -> None:
-        speed = value / 100
-        self._app.set_playback_speed(speed)
         self._speed_label.configure(text=f"{int(value)}%")
+        
+        # Label follows the drag; the app only sees the value it settles on
+        self._pending_speed = value / 100
+        if self._speed_after_id is not None:
+            self._root.after_cancel(self._speed_after_id)
+        self._speed_after_id = self._root.after(SLIDER_DEBOUNCE_MS, self._apply_speed)
+    
+    def _apply_speed(self) -> None:
+        self._speed_after_id = None
+        self._app.set_playback_speed(self._pending_speed)
     
     def _on_progress_click(self, event) -> None:
         width = self._progress_bar.winfo_width()
         if width > 0:
             percent = event.x / width
             self._app.seek_percent(percent)
-            self._progress_bar.set(percent)
+            self._set_progress(percent)
     
     def _on_track_change(self, choice: str) -> None:
-        if choice == "All tracks":
-            self._app.reload_track(None)
-        else:
-            # Extract track index
-            try:
-                idx = int(choice.split(":")[0].replace("Track ", ""))
-                self._app.reload_track(idx)
-            except:
-                pass
+        # Unknown labels (i.e. "All tracks") map to None = all tracks
+        self._app.reload_track(self._track_label_to_index.get(choice))
         
         self._song_info.configure(
             text=f"{self._app.total_notes} notes  •  {self._fmt_time(self._app.song_duration)}"
@@ -475,35 +625,49 @@ class ModernWindow:
     # === LIBRARY ACTIONS ===
     
     def _update_library(self) -> None:
-        # Clear existing buttons
-        for btn in self._file_buttons:
-            btn.destroy()
-        self._file_buttons.clear()
-        
-        # Add file buttons
-        for i, filepath in enumerate(self._app.config.recent_files[:15]):
-            path = Path(filepath)
-            name = path.stem
+        recent = self._app.config.recent_files[:15]
+        buttons = self._file_buttons
+        
+        for i, filepath in enumerate(recent):
+            # Plain string ops; a Path is only built if the entry is clicked
+            name = os.path.splitext(os.path.basename(filepath))[0]
             if len(name) > 40:
                 name = name[:37] + "..."
             
-            btn = ctk.CTkButton(self._file_scroll, text=f"🎵  {name}",
-                               anchor='w', height=40,
-                               fg_color="transparent", hover_color="#2b2b2b",
-                               font=ctk.CTkFont(size=13),
-                               command=lambda p=path: self._on_file_click(p))
-            btn.pack(fill='x', pady=2)
-            self._file_buttons.append(btn)
-        
-        if not self._file_buttons:
-            label = ctk.CTkLabel(self._file_scroll, text="No recent files",
-                                text_color="#666666")
-            label.pack(pady=20)
-    
-    def _on_file_click(self, path: Path) -> None:
+            text = f"🎵  {name}"
+            command = partial(self._on_file_click, filepath)
+            
+            # Reuse a pooled button; only create one when the list grows
+            if i < len(buttons):
+                btn = buttons[i]
+                btn.configure(text=text, command=command)
+            else:
+                btn = ctk.CTkButton(self._file_scroll, text=text,
+                                   anchor='w', height=40,
+                                   fg_color="transparent", hover_color=COLOR_SURFACE,
+                                   font=_font(13),
+                                   command=command)
+                buttons.append(btn)
+            
+            if not btn.winfo_manager():
+                btn.pack(fill='x', pady=2)
+        
+        # Hide spare buttons when the list shrinks
+        for btn in buttons[len(recent):]:
+            btn.pack_forget()
+        
+        if recent:
+            self._empty_label.pack_forget()
+        elif not self._empty_label.winfo_manager():
+            self._empty_label.pack(pady=20)
+    
+    def _on_file_click(self, filepath: str) -> None:
+        path = Path(filepath)
         if path.exists():
             self._load_file(path)
+            # CTkTabview.set() does not fire its command callback
             self._tabview.set("Player")
+            self._on_tab_change()
         else:
             messagebox.showwarning("File Not Found", f"File no longer exists:\n{path.name}")
     
@@ -521,8 +685,9 @@ class ModernWindow:
                 ("Sky sheets", "*.json *.skysheet *.txt"),
             ]
         )
-        for path in paths:
-            self._app.config.add_recent_file(path)
+        if not paths:
+            return
+        self._app.config.add_recent_files(paths)
         self._app.config.save()
         self._update_library()
     
@@ -561,46 +726,87 @@ class ModernWindow:
     
     # === OBSERVERS ===
     
+    @_marshal
     def _on_state_change(self, state: PlaybackState) -> None:
-        states = {
-            PlaybackState.READY: ("● Ready", "#888888", "▶"),
-            PlaybackState.PLAYING: ("● Playing", "#4ecca3", "⏸"),
-            PlaybackState.PAUSED: ("● Paused", "#f0ad4e", "▶"),
-            PlaybackState.STOPPED: ("● Stopped", "#888888", "▶"),
-        }
-        
-        text, color, btn = states.get(state, ("● Ready", "#888888", "▶"))
+        text, color, btn = _STATE_MAP.get(state, _DEFAULT_STATE)
         self._status_label.configure(text=text, text_color=color)
         self._play_btn.configure(text=btn)
         
         if state == PlaybackState.STOPPED:
-            self._progress_bar.set(0)
-            self._time_current.configure(text="0:00")
+            self._reset_progress()
     
     def _on_progress(self, current: int, total: int) -> None:
         if total > 0:
-            self._progress_bar.set(current / total)
+            self._pending_progress = current / total
+            if self._active_tab == "Player":
+                self._schedule_ui_refresh()
     
     def _on_time_update(self, current: float, total: float) -> None:
-        self._time_current.configure(text=self._fmt_time(current))
-    
+        self._pending_time = current
+        if self._active_tab == "Player":
+            self._schedule_ui_refresh()
+    
+    def _on_tab_change(self) -> None:
+        self._active_tab = self._tabview.get()
+        # Updates held back while the Player tab was hidden land in one flush
+        if self._active_tab == "Player":
+            self._schedule_ui_refresh()
+    
+    def _schedule_ui_refresh(self) -> None:
+        """Coalesce position updates into one repaint per UI_REFRESH_MS.
+        
+        Widgets are only touched in _flush_ui on the Tk event loop, so the
+        position observers need no _marshal of their own.
+        """
+        if not self._ui_refresh_scheduled:
+            self._ui_refresh_scheduled = True
+            self._root.after(UI_REFRESH_MS, self._flush_ui)
+    
+    def _flush_ui(self) -> None:
+        # Clear the flag before reading so a value stored meanwhile is
+        # either picked up here or schedules the next flush
+        self._ui_refresh_scheduled = False
+        progress, self._pending_progress = self._pending_progress, None
+        current, self._pending_time = self._pending_time, None
+        
+        if progress is not None:
+            self._set_progress(progress)
+        if current is not None:
+            self._set_time_text(self._fmt_time(current))
+    
+    def _set_progress(self, fraction: float) -> None:
+        """Move the progress bar, skipping changes too small to show."""
+        fraction = round(fraction, 3)
+        if fraction != self._ui_state["progress"]:
+            self._ui_state["progress"] = fraction
+            self._progress_bar.set(fraction)
+    
+    def _set_time_text(self, text: str) -> None:
+        """Update the elapsed time label if the shown text changed."""
+        # The text changes once a second; most 20 Hz flushes skip this
+        if text != self._ui_state["time"]:
+            self._ui_state["time"] = text
+            self._time_current.configure(text=text)
+    
+    def _reset_progress(self) -> None:
+        """Rewind the position display, dropping any pending update."""
+        self._pending_progress = self._pending_time = None
+        self._set_progress(0.0)
+        self._set_time_text("0:00")
+    
+    @_marshal
     def _on_countdown(self, seconds: int) -> None:
-        if seconds > 0:
-            self._countdown_label.configure(text=str(seconds))
-            self._countdown_label.pack(pady=10)
-        else:
-            self._countdown_label.pack_forget()
+        self._countdown_label.configure(text=str(seconds) if seconds > 0 else "")
     
     def _fmt_time(self, seconds: float) -> str:
-        m, s = divmod(int(seconds), 60)
-        return f"{m}:{s:02d}"
+        return _fmt_time_int(int(seconds))
     
     def _on_close(self) -> None:
         self._app.config.window_x = self._root.winfo_x()
         self._app.config.window_y = self._root.winfo_y()
         self._app.config.window_width = self._root.winfo_width()
         self._app.config.window_height = self._root.winfo_height()
-        self._app.config.save()
+        self._app.config.save_now()
         self._app.shutdown()
         self._root.destroy()
     
@@ -1,7 +1,6 @@
 """Speed/tempo slider widget."""
 
 import tkinter as tk
-from tkinter import ttk
 from typing import Callable, Optional
 
 
@@ -18,6 +17,7 @@ class SpeedSlider(tk.Frame):
         self.configure(bg="#2b2b2b")
         
         self._on_change = on_change
+        self._last_percentage = 100
         
         # Label
         self._title = tk.Label(
@@ -36,18 +36,21 @@ class SpeedSlider(tk.Frame):
         # Value variable
         self._value = tk.DoubleVar(value=1.0)
         
-        # Slider
-        style = ttk.Style()
-        style.configure("Custom.Horizontal.TScale", background="#2b2b2b")
-        
-        self._slider = ttk.Scale(
+        # Slider; a classic tk.Scale skips the ttk theme engine's image
+        # redraws, and we only need a horizontal drag
+        self._slider = tk.Scale(
             slider_frame,
             from_=0.5,
             to=1.5,
+            resolution=0.01,
             orient=tk.HORIZONTAL,
+            showvalue=False,
+            sliderrelief=tk.FLAT,
+            bg="#2b2b2b",
+            highlightthickness=0,
+            troughcolor="#404040",
             variable=self._value,
-            command=self._on_slider_change,
-            style="Custom.Horizontal.TScale"
+            command=self._on_slider_change
         )
         self._slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
@@ -65,7 +68,13 @@ class SpeedSlider(tk.Frame):
     def _on_slider_change(self, value: str) -> None:
         """Handle slider value changes."""
         speed = float(value)
-        percentage = int(speed * 100)
+        # Values arrive snapped to 0.01; round so e.g. 0.57 isn't read as 56%
+        percentage = round(speed * 100)
+        
+        # Drags fire per sub-pixel; ignore moves that don't change the percent
+        if percentage == self._last_percentage:
+            return
+        self._last_percentage = percentage
         self._value_label.config(text=f"{percentage}%")
         
         if self._on_change:
@@ -78,5 +87,6 @@ class SpeedSlider(tk.Frame):
     def set_value(self, speed: float) -> None:
         """Set the speed value."""
         self._value.set(speed)
-        percentage = int(speed * 100)
+        percentage = round(speed * 100)
+        self._last_percentage = percentage
         self._value_label.config(text=f"{percentage}%")
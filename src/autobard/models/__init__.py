@@ -7,6 +7,8 @@ from .mapping_table import (
     FLAT_KEYS,
     SHARPS_SUPPORTED,
     FLATS_SUPPORTED,
+    KEY_TABLE,
+    key_index,
 )
 from .note import KeyPress, GameNote, NoteEvent, SongInfo
 
@@ -22,6 +24,8 @@ __all__ = [
     "FLAT_KEYS",
     "SHARPS_SUPPORTED",
     "FLATS_SUPPORTED",
+    "KEY_TABLE",
+    "key_index",
     # Dataclasses
     "KeyPress",
     "GameNote",
@@ -1,36 +1,40 @@
-"""Enumerations for the autobard application."""
+"""Enumerations for the autobard application.
 
-from enum import Enum, auto
+These are IntEnums: members hash and compare as plain ints, which keeps
+the dict lookups on the note-to-key path cheap.
+"""
 
+from enum import IntEnum
 
-class Pitch(Enum):
+
+class Pitch(IntEnum):
     """Pitch levels for the game's 3-octave range."""
-    HIGH = auto()
-    MID = auto()
-    LOW = auto()
+    HIGH = 0
+    MID = 1
+    LOW = 2
 
 
-class NoteName(Enum):
-    """Note names in Jianpu notation (1-7)."""
-    DO = 1
-    RE = 2
-    MI = 3
-    FA = 4
-    SOL = 5
-    LA = 6
-    TI = 7
+class NoteName(IntEnum):
+    """Note names in Jianpu notation (1-7), numbered from 0."""
+    DO = 0
+    RE = 1
+    MI = 2
+    FA = 3
+    SOL = 4
+    LA = 5
+    TI = 6
 
 
-class Accidental(Enum):
+class Accidental(IntEnum):
     """Note accidentals (sharps and flats)."""
-    NATURAL = auto()
-    SHARP = auto()
-    FLAT = auto()
+    NATURAL = 0
+    SHARP = 1
+    FLAT = 2
 
 
-class PlaybackState(Enum):
+class PlaybackState(IntEnum):
     """States for the playback controller."""
-    READY = auto()
-    PLAYING = auto()
-    PAUSED = auto()
-    STOPPED = auto()
+    READY = 0
+    PLAYING = 1
+    PAUSED = 2
+    STOPPED = 3
@@ -6,7 +6,10 @@ Based on the verified game key bindings:
 - Flats (b): Hold CTRL + key (only Mib, Tib)
 """
 
-from .enums import Pitch, NoteName
+from typing import Optional
+
+from .enums import Pitch, NoteName, Accidental
+from .note import KeyPress
 
 
 # Natural Notes (White Keys) - Single Key Press
@@ -92,3 +95,40 @@ FLATS_SUPPORTED: frozenset[NoteName] = frozenset({
     NoteName.MI,
     NoteName.TI,
 })
+
+# Shared modifier tuples; every KeyPress reuses one of these
+_NO_MOD: tuple[str, ...] = ()
+_SHIFT: tuple[str, ...] = ("shift",)
+_CTRL: tuple[str, ...] = ("ctrl",)
+
+
+def key_index(pitch: Pitch, name: NoteName, accidental: Accidental) -> int:
+    """Pack a note into its KEY_TABLE index (dense, 0-62)."""
+    return (pitch * 7 + name) * 3 + accidental
+
+
+def _build_key_table() -> tuple[KeyPress, ...]:
+    """Resolve every (pitch, name, accidental) to its KeyPress.
+    
+    Unsupported sharps and flats get the natural key, so lookups never
+    need to branch on the accidental.
+    """
+    size = len(Pitch) * len(NoteName) * len(Accidental)
+    table: list[Optional[KeyPress]] = [None] * size
+    for pitch in Pitch:
+        for name in NoteName:
+            natural = KeyPress(NATURAL_KEYS[pitch][name], _NO_MOD)
+            table[key_index(pitch, name, Accidental.NATURAL)] = natural
+            table[key_index(pitch, name, Accidental.SHARP)] = (
+                KeyPress(SHARP_KEYS[pitch][name], _SHIFT)
+                if name in SHARPS_SUPPORTED else natural
+            )
+            table[key_index(pitch, name, Accidental.FLAT)] = (
+                KeyPress(FLAT_KEYS[pitch][name], _CTRL)
+                if name in FLATS_SUPPORTED else natural
+            )
+    return tuple(table)
+
+
+# Flat lookup for every note: a plain index, no hashing or branches
+KEY_TABLE: tuple[KeyPress, ...] = _build_key_table()
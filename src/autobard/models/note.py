@@ -1,12 +1,14 @@
 """Data classes for notes and key presses."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from .enums import Pitch, NoteName, Accidental
 
+_new = object.__new__
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class KeyPress:
     """Immutable representation of a keyboard action.
     
@@ -16,14 +18,18 @@ class KeyPress:
     """
     key: str
     modifiers: tuple[str, ...] = ()
+    _str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Frozen, so the text never changes; build it once for the log calls
+        text = f"{'+'.join(self.modifiers)}+{self.key}" if self.modifiers else self.key
+        object.__setattr__(self, "_str", text)
     
     def __str__(self) -> str:
-        if self.modifiers:
-            return f"{'+'.join(self.modifiers)}+{self.key}"
-        return self.key
+        return self._str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameNote:
     """Represents a note in the game's notation system.
     
@@ -45,10 +51,12 @@ class GameNote:
         return f"{self.pitch.name}-{self.name.name}{acc_str}"
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteEvent:
     """Represents a MIDI note event with timing information.
     
+    Uses __slots__ since songs allocate one instance per note.
+    
     Attributes:
         note: MIDI note number (0-127)
         velocity: Note velocity/volume (0-127)
@@ -60,6 +68,27 @@ class NoteEvent:
     time_delta: float
     is_note_on: bool = True
     
+    @classmethod
+    def _make(
+        cls,
+        note: int,
+        velocity: int,
+        time_delta: float,
+        is_note_on: bool = True
+    ) -> 'NoteEvent':
+        """Build an event from already-validated values.
+        
+        Skips __init__ and __post_init__ validation; for bulk rewrites of
+        existing events (transpose, window filtering) where the values are
+        known to be in range.
+        """
+        obj = _new(cls)
+        obj.note = note
+        obj.velocity = velocity
+        obj.time_delta = time_delta
+        obj.is_note_on = is_note_on
+        return obj
+    
     def __post_init__(self) -> None:
         if not 0 <= self.note <= 127:
             raise ValueError(f"MIDI note must be 0-127, got {self.note}")
@@ -3,7 +3,8 @@
 import ctypes
 import time
 import logging
-from typing import Set, List
+from functools import lru_cache
+from typing import Sequence, Set
 from ctypes import wintypes
 
 from ..models.note import KeyPress
@@ -55,6 +56,34 @@ class INPUT(ctypes.Structure):
     ]
 
 
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
+def _scan_code(key: str) -> int:
+    """Get scan code for a key."""
+    return SCAN_CODES.get(key) or SCAN_CODES.get(key.lower(), 0)
+
+
+@lru_cache(maxsize=None)
+def _key_input(scan_code: int, key_up: bool) -> INPUT:
+    """Get the shared INPUT for one scan code event.
+    
+    SendInput only reads its array, so each event is built once. Fields
+    not set here (wVk, time, dwExtraInfo) stay zero/NULL from ctypes.
+    """
+    inp = INPUT()
+    inp.type = INPUT_KEYBOARD
+    inp.ki.wScan = scan_code
+    inp.ki.dwFlags = (KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP) if key_up else KEYEVENTF_SCANCODE
+    return inp
+
+
+@lru_cache(maxsize=None)
+def _input_array(count: int) -> type:
+    """Get the ctypes array type holding count INPUTs."""
+    return INPUT * count
+
+
 class HighPerfInputService:
     """High-performance keyboard input using direct Win32 SendInput.
     
@@ -64,65 +93,43 @@ class HighPerfInputService:
     
     def __init__(self):
         self._held_modifiers: Set[str] = set()
+        # KeyPresses are few and shared, so each one's array is built once
+        self._press_batches: dict[KeyPress, tuple[int, ctypes.Array]] = {}
         self._send_input = ctypes.windll.user32.SendInput
         self._send_input.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
         self._send_input.restype = wintypes.UINT
         logger.debug("High-performance input service initialized")
     
-    def _make_input(self, scan_code: int, key_up: bool = False) -> INPUT:
-        """Create an INPUT structure for SendInput."""
-        flags = KEYEVENTF_SCANCODE
-        if key_up:
-            flags |= KEYEVENTF_KEYUP
-        
-        inp = INPUT()
-        inp.type = INPUT_KEYBOARD
-        inp.ki.wVk = 0
-        inp.ki.wScan = scan_code
-        inp.ki.dwFlags = flags
-        inp.ki.time = 0
-        inp.ki.dwExtraInfo = None
-        return inp
-    
-    def _get_scan_code(self, key: str) -> int:
-        """Get scan code for a key."""
-        return SCAN_CODES.get(key.lower(), 0)
+    def _press_batch(self, key_press: KeyPress) -> tuple[int, ctypes.Array]:
+        """Get the prebuilt SendInput array for one key press."""
+        batch = self._press_batches.get(key_press)
+        if batch is None:
+            mod_scans = [scan for scan in map(_scan_code, key_press.modifiers) if scan]
+            main_scan = _scan_code(key_press.key)
+            key_scans = [main_scan] if main_scan else []
+            # Modifiers down, key down, key up, modifiers up (reverse order)
+            inputs = [_key_input(scan, False) for scan in mod_scans + key_scans]
+            inputs += [_key_input(scan, True) for scan in key_scans + mod_scans[::-1]]
+            batch = (len(inputs), _input_array(len(inputs))(*inputs))
+            self._press_batches[key_press] = batch
+        return batch
     
     def press(self, key_press: KeyPress, delay_ms: int = 0) -> None:
         """Execute a key press with optional modifiers."""
-        inputs = []
-        
-        # Press modifiers
-        for mod in key_press.modifiers:
-            scan = self._get_scan_code(mod)
-            if scan:
-                inputs.append(self._make_input(scan, key_up=False))
-        
-        # Press main key
-        main_scan = self._get_scan_code(key_press.key)
-        if main_scan:
-            inputs.append(self._make_input(main_scan, key_up=False))
-        
-        # Release main key
-        if main_scan:
-            inputs.append(self._make_input(main_scan, key_up=True))
-        
-        # Release modifiers (reverse order)
-        for mod in reversed(key_press.modifiers):
-            scan = self._get_scan_code(mod)
-            if scan:
-                inputs.append(self._make_input(scan, key_up=True))
-        
         # Send all inputs at once
-        if inputs:
-            arr = (INPUT * len(inputs))(*inputs)
-            self._send_input(len(inputs), arr, ctypes.sizeof(INPUT))
+        count, arr = self._press_batch(key_press)
+        if count:
+            self._send_input(count, arr, _INPUT_SIZE)
         
         if delay_ms > 0:
             time.sleep(delay_ms / 1000.0)
     
-    def press_multiple(self, key_presses: List[KeyPress], delay_ms: int = 0, strum_ms: int = 0) -> None:
-        """Press multiple keys for chords with optional strum effect."""
+    def press_multiple(self, key_presses: Sequence[KeyPress], delay_ms: int = 0, strum_ms: int = 0) -> None:
+        """Press multiple keys for chords with optional strum effect.
+        
+        Without strum the whole chord is two SendInput calls: every
+        key-down (modifiers first), the hold, then every key-up.
+        """
         if not key_presses:
             return
         
@@ -131,53 +138,39 @@ class HighPerfInputService:
         for kp in key_presses:
             all_modifiers.update(kp.modifiers)
         
-        inputs = []
-        
-        # Press all modifiers first
-        for mod in all_modifiers:
-            scan = self._get_scan_code(mod)
-            if scan:
-                inputs.append(self._make_input(scan, key_up=False))
-        
-        if inputs:
-            arr = (INPUT * len(inputs))(*inputs)
-            self._send_input(len(inputs), arr, ctypes.sizeof(INPUT))
-            inputs = []
-        
-        # Press keys with optional strum
-        strum_delay = strum_ms / 1000.0
-        for i, kp in enumerate(key_presses):
-            scan = self._get_scan_code(kp.key)
-            if scan:
-                inp = self._make_input(scan, key_up=False)
-                self._send_input(1, ctypes.byref(inp), ctypes.sizeof(INPUT))
-            
-            if strum_ms > 0 and i < len(key_presses) - 1:
-                time.sleep(strum_delay)
+        mod_scans = [scan for scan in map(_scan_code, all_modifiers) if scan]
+        key_scans = [scan for scan in (_scan_code(kp.key) for kp in key_presses) if scan]
+        
+        # Press all modifiers first, then the keys
+        downs = [_key_input(scan, False) for scan in mod_scans]
+        if strum_ms > 0:
+            # Strummed keys need a send each so the gaps fall between them
+            self._send(downs)
+            strum_delay = strum_ms / 1000.0
+            for i, scan in enumerate(key_scans):
+                if i:
+                    time.sleep(strum_delay)
+                self._send([_key_input(scan, False)])
+        else:
+            downs.extend(_key_input(scan, False) for scan in key_scans)
+            self._send(downs)
         
         time.sleep(0.015)  # Brief hold
         
-        # Release all keys
-        for kp in key_presses:
-            scan = self._get_scan_code(kp.key)
-            if scan:
-                inp = self._make_input(scan, key_up=True)
-                self._send_input(1, ctypes.byref(inp), ctypes.sizeof(INPUT))
-        
-        # Release modifiers
-        for mod in all_modifiers:
-            scan = self._get_scan_code(mod)
-            if scan:
-                inp = self._make_input(scan, key_up=True)
-                self._send_input(1, ctypes.byref(inp), ctypes.sizeof(INPUT))
+        # Release all keys, then modifiers
+        self._send([_key_input(scan, True) for scan in key_scans + mod_scans])
         
         if delay_ms > 0:
             time.sleep(delay_ms / 1000.0)
     
+    def _send(self, inputs: list[INPUT]) -> None:
+        """Send a batch of INPUT events in one SendInput call."""
+        count = len(inputs)
+        if count:
+            self._send_input(count, _input_array(count)(*inputs), _INPUT_SIZE)
+    
     def release_all(self) -> None:
         """Release all potentially held keys."""
         logger.info("Releasing all held keys")
-        for key in list(SCAN_CODES.keys()):
-            scan = SCAN_CODES[key]
-            inp = self._make_input(scan, key_up=True)
-            self._send_input(1, ctypes.byref(inp), ctypes.sizeof(INPUT))
+        for scan in SCAN_CODES.values():
+            self._send_input(1, ctypes.byref(_key_input(scan, True)), _INPUT_SIZE)
@@ -2,12 +2,19 @@
 
 import logging
 import time
-from typing import Set
+from typing import Callable, Optional, Sequence, Set
 
 from ..models.note import KeyPress
 
 logger = logging.getLogger(__name__)
 
+# Modifier names -> keyboard library key names
+_MODIFIER_KEYS = {
+    "shift": "shift",
+    "ctrl": "ctrl",
+    "alt": "alt",
+}
+
 
 class KeyboardService:
     """Service for simulating keyboard input.
@@ -20,6 +27,10 @@ class KeyboardService:
         self._held_modifiers: Set[str] = set()
         self._initialized = False
         self._keyboard = None
+        # keyboard.press/release, bound once so per-note calls skip the
+        # module attribute lookup
+        self._kb_press: Optional[Callable[[str], None]] = None
+        self._kb_release: Optional[Callable[[str], None]] = None
     
     def _ensure_initialized(self) -> None:
         """Lazy initialization of keyboard library."""
@@ -29,12 +40,22 @@ class KeyboardService:
         try:
             import keyboard
             self._keyboard = keyboard
+            self._kb_press = keyboard.press
+            self._kb_release = keyboard.release
             self._initialized = True
             logger.debug("Keyboard service initialized (using keyboard library)")
         except ImportError as e:
             logger.error("keyboard library not installed")
             raise RuntimeError("keyboard library required for keyboard simulation") from e
     
+    def _key_funcs(self) -> tuple[Callable[[str], None], Callable[[str], None]]:
+        """Get the bound keyboard press/release functions, initializing first."""
+        self._ensure_initialized()
+        kb_press, kb_release = self._kb_press, self._kb_release
+        if kb_press is None or kb_release is None:
+            raise RuntimeError("Keyboard service is not initialized")
+        return kb_press, kb_release
+    
     def press(self, key_press: KeyPress, delay_ms: int = 0) -> None:
         """Execute a key press with optional modifiers.
         
@@ -42,7 +63,7 @@ class KeyboardService:
             key_press: KeyPress object with key and modifiers
             delay_ms: Optional delay in milliseconds after the press
         """
-        self._ensure_initialized()
+        kb_press, kb_release = self._key_funcs()
         
         try:
             # Press modifiers first
@@ -54,9 +75,9 @@ class KeyboardService:
                 time.sleep(0.01)
             
             # Press and release the main key using scan codes
-            self._keyboard.press(key_press.key)
+            kb_press(key_press.key)
             time.sleep(0.02)  # Hold key briefly
-            self._keyboard.release(key_press.key)
+            kb_release(key_press.key)
             
             # Release modifiers
             for mod in key_press.modifiers:
@@ -75,20 +96,20 @@ class KeyboardService:
     
     def press_key(self, key: str) -> None:
         """Press and release a single key without modifiers."""
-        self._ensure_initialized()
-        self._keyboard.press(key)
+        kb_press, kb_release = self._key_funcs()
+        kb_press(key)
         time.sleep(0.02)
-        self._keyboard.release(key)
+        kb_release(key)
     
-    def press_multiple(self, key_presses: list[KeyPress], delay_ms: int = 0, strum_ms: int = 0) -> None:
+    def press_multiple(self, key_presses: Sequence[KeyPress], delay_ms: int = 0, strum_ms: int = 0) -> None:
         """Press multiple keys for chords with optional strum effect.
         
         Args:
-            key_presses: List of KeyPress objects to press together
+            key_presses: KeyPress objects to press together (any sequence)
             delay_ms: Optional delay after all keys are pressed
             strum_ms: Delay between each key press (strum effect, 0 = simultaneous)
         """
-        self._ensure_initialized()
+        press, release = self._key_funcs()
         
         if not key_presses:
             return
@@ -107,20 +128,21 @@ class KeyboardService:
                 time.sleep(0.01)
             
             # Press keys with optional strum delay
+            sleep = time.sleep
             keys_pressed = []
             strum_delay = strum_ms / 1000.0
             for i, kp in enumerate(key_presses):
-                self._keyboard.press(kp.key)
+                press(kp.key)
                 keys_pressed.append(kp.key)
                 # Add strum delay between notes (not after last one)
                 if strum_ms > 0 and i < len(key_presses) - 1:
-                    time.sleep(strum_delay)
+                    sleep(strum_delay)
             
-            time.sleep(0.02)  # Hold briefly
+            sleep(0.02)  # Hold briefly
             
             # Release all keys
             for key in keys_pressed:
-                self._keyboard.release(key)
+                release(key)
             
             # Release all modifiers
             for mod in all_modifiers:
@@ -139,28 +161,23 @@ class KeyboardService:
     
     def _press_modifier(self, modifier: str) -> None:
         """Press and hold a modifier key."""
-        self._ensure_initialized()
+        kb_press, _ = self._key_funcs()
         mod_key = self._get_modifier_key(modifier)
         if mod_key:
-            self._keyboard.press(mod_key)
+            kb_press(mod_key)
             self._held_modifiers.add(modifier)
     
     def _release_modifier(self, modifier: str) -> None:
         """Release a modifier key."""
-        self._ensure_initialized()
+        _, kb_release = self._key_funcs()
         mod_key = self._get_modifier_key(modifier)
         if mod_key:
-            self._keyboard.release(mod_key)
+            kb_release(mod_key)
             self._held_modifiers.discard(modifier)
     
     def _get_modifier_key(self, modifier: str) -> str:
         """Convert modifier string to keyboard library key name."""
-        modifier_map = {
-            "shift": "shift",
-            "ctrl": "ctrl", 
-            "alt": "alt",
-        }
-        return modifier_map.get(modifier.lower(), modifier)
+        return _MODIFIER_KEYS.get(modifier.lower(), modifier)
     
     def release_all(self) -> None:
         """Emergency release of all held keys.
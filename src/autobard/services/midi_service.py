@@ -159,9 +159,9 @@ class MidiService:
     
     def _build_song_info(self, filename: str, duration: float) -> SongInfo:
         """Build song metadata from loaded events."""
-        note_on_events = [e for e in self._events if e.is_note_on]
+        notes = [e.note for e in self._events if e.is_note_on]
         
-        if not note_on_events:
+        if not notes:
             return SongInfo(
                 filename=filename,
                 duration=duration,
@@ -170,11 +170,10 @@ class MidiService:
                 max_note=0,
             )
         
-        notes = [e.note for e in note_on_events]
         return SongInfo(
             filename=filename,
             duration=duration,
-            note_count=len(note_on_events),
+            note_count=len(notes),
             min_note=min(notes),
             max_note=max(notes),
         )
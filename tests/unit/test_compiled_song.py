@@ -0,0 +1,162 @@
+"""Tests for CompiledSong class."""
+
+import pytest
+from autobard.models import NoteEvent
+from autobard.core import KeyMapper, NoteConverter
+from autobard.core.compiled_song import CompiledSong, find_chord_groups
+
+
+def compile_events(events: list[NoteEvent], offset: int = 0) -> CompiledSong:
+    """Compile events with default converter and mapper."""
+    return CompiledSong.compile(events, offset, NoteConverter(), KeyMapper())
+
+
+class TestFindChordGroups:
+    """Test chord grouping."""
+
+    def test_empty_events(self):
+        """No events should give no groups."""
+        assert find_chord_groups([]) == []
+
+    def test_groups_close_notes(self):
+        """Notes within the threshold join the previous group."""
+        events = [
+            NoteEvent(note=60, velocity=100, time_delta=0.0),
+            NoteEvent(note=64, velocity=100, time_delta=0.02),
+            NoteEvent(note=67, velocity=100, time_delta=0.5),
+            NoteEvent(note=72, velocity=100, time_delta=0.05),
+            NoteEvent(note=74, velocity=100, time_delta=0.3),
+        ]
+        assert find_chord_groups(events) == [(0, 2), (2, 4), (4, 5)]
+
+
+class TestCompiledSongCompile:
+    """Test compiling events into playback data."""
+
+    def test_empty_events(self):
+        """Compiling no events should give an empty song."""
+        song = compile_events([])
+        assert song.total_notes == 0
+        assert song.duration == 0.0
+
+    def test_single_notes(self, sample_note_events):
+        """Each separated note should compile to one entry."""
+        song = compile_events(sample_note_events)
+        assert song.total_notes == len(sample_note_events)
+        assert song.duration == pytest.approx(2.0)
+
+    def test_chord_grouping(self):
+        """Notes within the chord threshold should be grouped."""
+        events = [
+            NoteEvent(note=60, velocity=100, time_delta=0.5),
+            NoteEvent(note=64, velocity=100, time_delta=0.01),
+            NoteEvent(note=67, velocity=100, time_delta=0.0),
+            NoteEvent(note=72, velocity=100, time_delta=0.5),
+        ]
+        song = compile_events(events)
+        assert song.notes[0].chord_size == 3
+        assert song.notes[0].is_chord_start is True
+        assert len(song.get_chord_key_presses(0)) == 3
+        assert song.notes[3].chord_size == 1
+
+    def test_chord_key_presses_are_shared(self):
+        """Chord lookups should reuse the pre-built tuple."""
+        events = [
+            NoteEvent(note=60, velocity=100, time_delta=0.0),
+            NoteEvent(note=64, velocity=100, time_delta=0.0),
+        ]
+        song = compile_events(events)
+        assert song.get_chord_key_presses(0) is song.get_chord_key_presses(0)
+
+    def test_steps_dispatch_chords_and_singles(self):
+        """Chord starts advance by the chord size; other indices by one."""
+        events = [
+            NoteEvent(note=60, velocity=100, time_delta=0.5),
+            NoteEvent(note=64, velocity=100, time_delta=0.01),
+            NoteEvent(note=72, velocity=100, time_delta=0.5),
+        ]
+        song = compile_events(events)
+        assert song.steps[0] == (song.get_chord_key_presses(0), 2)
+        assert song.steps[1] == (song.get_key_press(1), 1)
+        assert song.steps[2] == (song.get_key_press(2), 1)
+
+    def test_key_press_lookup(self):
+        """Compiled notes should resolve to the mapped key."""
+        events = [NoteEvent(note=60, velocity=100, time_delta=0.0)]
+        song = compile_events(events)
+        assert song.get_key_press(0).key == "a"  # MID-DO
+
+    def test_equal_key_presses_are_shared(self):
+        """Notes that resolve to the same key should share one KeyPress."""
+        events = [
+            NoteEvent(note=120, velocity=100, time_delta=0.0),
+            NoteEvent(note=121, velocity=100, time_delta=0.5),
+        ]
+        song = compile_events(events)
+        assert song.get_key_press(0) is song.get_key_press(1)
+
+    def test_precomputed_chord_groups(self):
+        """Passing precomputed groups should compile the same song."""
+        events = [
+            NoteEvent(note=60, velocity=100, time_delta=0.5),
+            NoteEvent(note=64, velocity=100, time_delta=0.01),
+            NoteEvent(note=72, velocity=100, time_delta=0.5),
+        ]
+        groups = find_chord_groups(events)
+        song = CompiledSong.compile(
+            events, 0, NoteConverter(), KeyMapper(), chord_groups=groups
+        )
+        assert song.notes == compile_events(events).notes
+
+    def test_note_times_are_cumulative(self, sample_note_events):
+        """Note times should hold the running sum of time deltas."""
+        song = compile_events(sample_note_events)
+        expected = []
+        cumulative = 0.0
+        for note in song.notes:
+            cumulative += note.time_delta
+            expected.append(pytest.approx(cumulative))
+        assert list(song.note_times) == expected
+
+
+class TestCompiledSongDelaySchedule:
+    """Test precomputed delay schedule."""
+
+    def test_schedule_matches_time_deltas_without_options(self, sample_note_events):
+        """With timing options off, delays equal the raw time deltas."""
+        song = compile_events(sample_note_events)
+        schedule = song.get_delay_schedule(False, False)
+        assert list(schedule) == [n.time_delta for n in song.notes]
+
+    def test_velocity_timing_lengthens_soft_notes(self):
+        """Soft notes should get a longer delay with velocity timing."""
+        events = [
+            NoteEvent(note=60, velocity=100, time_delta=0.0),
+            NoteEvent(note=62, velocity=40, time_delta=1.0),
+        ]
+        song = compile_events(events)
+        schedule = song.get_delay_schedule(False, True)
+        assert schedule[1] == pytest.approx(1.0 * (1.0 + 40 / 200))
+
+    def test_schedule_is_cached_per_options(self, sample_note_events):
+        """Same options should reuse the schedule; new options rebuild it."""
+        song = compile_events(sample_note_events)
+        first = song.get_delay_schedule(True, True)
+        assert song.get_delay_schedule(True, True) is first
+        assert song.get_delay_schedule(False, True) is not first
+
+
+class TestCompiledSongDensity:
+    """Test note density precomputation."""
+
+    def test_density_matches_window_count(self):
+        """Density should count notes within one second either side."""
+        deltas = [0.0, 0.1, 0.1, 0.1, 1.5, 0.2, 2.0]
+        events = [NoteEvent(note=60, velocity=100, time_delta=d) for d in deltas]
+        song = compile_events(events)
+        times = list(song.note_times)
+        expected = [
+            sum(1 for tt in times if t - 1.0 <= tt <= t + 1.0) / 2.0
+            for t in times
+        ]
+        assert list(song.density_map) == pytest.approx(expected)
@@ -79,6 +79,12 @@ class TestKeyMapperFlat:
         assert result.key == "c"
         assert result.modifiers == ("ctrl",)
 
+    def test_modifier_tuples_are_shared(self, key_mapper: KeyMapper):
+        """Key presses with the same modifier should share one tuple."""
+        high = key_mapper.get_key_press(GameNote(Pitch.HIGH, NoteName.MI, Accidental.FLAT))
+        low = key_mapper.get_key_press(GameNote(Pitch.LOW, NoteName.MI, Accidental.FLAT))
+        assert high.modifiers is low.modifiers
+
 
 class TestKeyMapperFallback:
     """Test fallback behavior for unsupported accidentals."""
@@ -127,3 +133,21 @@ class TestKeyMapperAccidentalSupport:
         assert key_mapper.is_accidental_supported(NoteName.TI, Accidental.FLAT)
         assert not key_mapper.is_accidental_supported(NoteName.DO, Accidental.FLAT)
         assert not key_mapper.is_accidental_supported(NoteName.FA, Accidental.FLAT)
+
+
+class TestKeyPressStr:
+    """Test KeyPress text formatting."""
+    
+    def test_plain_key(self):
+        """A key without modifiers should format as the bare key."""
+        assert str(KeyPress("a")) == "a"
+    
+    def test_modified_key(self):
+        """Modifiers should be joined in front of the key."""
+        assert str(KeyPress("q", ("shift",))) == "shift+q"
+    
+    def test_cached_text_not_compared(self):
+        """Equality and hashing should only consider key and modifiers."""
+        assert KeyPress("e", ("ctrl",)) == KeyPress("e", ("ctrl",))
+        assert hash(KeyPress("e", ("ctrl",))) == hash(KeyPress("e", ("ctrl",)))
+        assert repr(KeyPress("e")) == "KeyPress(key='e', modifiers=())"
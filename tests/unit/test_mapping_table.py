@@ -9,6 +9,9 @@ from autobard.models import (
     FLAT_KEYS,
     SHARPS_SUPPORTED,
     FLATS_SUPPORTED,
+    Accidental,
+    KEY_TABLE,
+    key_index,
 )
 
 
@@ -109,3 +112,27 @@ class TestTotalGameKeys:
         sharps = sum(len(n) for n in SHARP_KEYS.values())
         flats = sum(len(n) for n in FLAT_KEYS.values())
         assert natural + sharps + flats == 36
+
+
+class TestKeyTable:
+    """Test the flat note -> KeyPress table."""
+    
+    def test_covers_every_note(self):
+        """Every pitch, name and accidental should have an entry."""
+        assert len(KEY_TABLE) == len(Pitch) * len(NoteName) * len(Accidental)
+    
+    def test_matches_nested_tables(self):
+        """Entries should agree with the per-accidental tables."""
+        for pitch in Pitch:
+            for name, key in SHARP_KEYS[pitch].items():
+                kp = KEY_TABLE[key_index(pitch, name, Accidental.SHARP)]
+                assert (kp.key, kp.modifiers) == (key, ("shift",))
+            for name, key in FLAT_KEYS[pitch].items():
+                kp = KEY_TABLE[key_index(pitch, name, Accidental.FLAT)]
+                assert (kp.key, kp.modifiers) == (key, ("ctrl",))
+    
+    def test_unsupported_accidental_shares_natural(self):
+        """Unsupported accidentals should reuse the natural KeyPress."""
+        natural = KEY_TABLE[key_index(Pitch.MID, NoteName.RE, Accidental.NATURAL)]
+        assert KEY_TABLE[key_index(Pitch.MID, NoteName.RE, Accidental.SHARP)] is natural
+        assert KEY_TABLE[key_index(Pitch.MID, NoteName.RE, Accidental.FLAT)] is natural
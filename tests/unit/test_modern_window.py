@@ -0,0 +1,88 @@
+"""Tests for ModernWindow tab tracking."""
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from autobard.gui.modern_window import ModernWindow
+
+
+class FakeTabview:
+    """Tabview stand-in that, like CTkTabview, ignores command on set()."""
+
+    def __init__(self, current: str):
+        self._current = current
+
+    def set(self, name: str) -> None:
+        self._current = name
+
+    def get(self) -> str:
+        return self._current
+
+
+class FakeRoot:
+    """Root stand-in that records scheduled callbacks."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func, *args):
+        self.scheduled.append(func)
+        return f"after#{len(self.scheduled)}"
+
+
+def make_window(active_tab: str) -> ModernWindow:
+    """Build a window without widgets, parked on the given tab."""
+    window = object.__new__(ModernWindow)
+    window._root = FakeRoot()
+    window._tabview = FakeTabview(active_tab)
+    window._active_tab = active_tab
+    window._ui_refresh_scheduled = False
+    window._pending_progress = None
+    window._pending_time = None
+    window._load_file = lambda path: None
+    return window
+
+
+class TestFileClick:
+    """Test switching to the Player tab from the library."""
+
+    def test_file_click_tracks_player_tab(self, tmp_path):
+        """Opening a library file should resume position updates."""
+        song = tmp_path / "song.mid"
+        song.write_bytes(b"")
+        window = make_window("Library")
+
+        window._on_file_click(str(song))
+
+        assert window._active_tab == "Player"
+        window._on_progress(1, 2)
+        assert window._ui_refresh_scheduled
+
+    def test_hidden_tab_skips_refresh(self):
+        """Progress on a hidden tab should not schedule a repaint."""
+        window = make_window("Library")
+
+        window._on_progress(1, 2)
+
+        assert window._pending_progress == 0.5
+        assert not window._ui_refresh_scheduled
+
+
+class TestToggleKey:
+    """Test the held-key guard on play/pause."""
+
+    def test_auto_repeat_toggles_once(self):
+        """Repeated KeyPress events before a release should toggle once."""
+        window = make_window("Player")
+        window._toggle_held = False
+        toggles = []
+        window._toggle_play = lambda: toggles.append(True)
+
+        for _ in range(5):
+            window._on_toggle_key()
+        assert len(toggles) == 1
+
+        window._on_toggle_release()
+        window._on_toggle_key()
+        assert len(toggles) == 2
@@ -93,6 +93,11 @@ class TestNoteConverterClamping:
         """Notes above range should clamp to HIGH pitch."""
         result = note_converter.convert(100)  # Way above range
         assert result.pitch == Pitch.HIGH
+    
+    def test_clamped_notes_share_table_entry(self, note_converter: NoteConverter):
+        """Out-of-range notes should return the same instance as the edge note."""
+        assert note_converter.convert(-5) is note_converter.convert(note_converter.min_midi_note)
+        assert note_converter.convert(200) is note_converter.convert(note_converter.max_midi_note)
 
 
 class TestNoteConverterAllSemitones:
@@ -2,7 +2,7 @@
 
 import pytest
 from autobard.models import NoteEvent
-from autobard.core import Transposer
+from autobard.core import Transposer, RangeStats, scan_range
 
 
 class TestTransposerOffset:
@@ -128,3 +128,65 @@ class TestTransposerAnalyze:
         ]
         result = transposer.analyze_range(events)
         assert result["fits_in_game"] is False
+
+
+class TestScanRange:
+    """Test single-pass range scanning."""
+    
+    def test_scan_empty_events(self):
+        """No note-on events should give no range."""
+        assert scan_range([]) is None
+    
+    def test_scan_finds_range(self, sample_note_events):
+        """Should find min/max and count in one pass."""
+        assert scan_range(sample_note_events) == RangeStats(60, 67, 5)
+    
+    def test_offset_accepts_range_stats(self, transposer: Transposer):
+        """RangeStats should work wherever a (min, max) range does."""
+        stats = RangeStats(36, 71, 10)
+        assert transposer.calculate_offset(stats) == transposer.calculate_offset((36, 71))
+
+
+class TestTransposerWindow:
+    """Test best-window search for wide songs."""
+    
+    def test_window_covers_dense_cluster(self, transposer: Transposer):
+        """The window should keep the most notes of a wide song."""
+        events = [NoteEvent(note=n, velocity=100, time_delta=0.1) for n in (60, 62, 64, 65, 67)]
+        events.append(NoteEvent(note=20, velocity=100, time_delta=0.1))
+        start, count = transposer.find_best_window(events)
+        assert count == 5
+        assert start <= 60 and start + 35 >= 67
+    
+    def test_window_with_precomputed_stats(self, transposer: Transposer):
+        """Passing precomputed stats should give the same window."""
+        events = [NoteEvent(note=n, velocity=100, time_delta=0.1) for n in (20, 60, 62, 100)]
+        stats = scan_range(events)
+        assert transposer.find_best_window(events, stats) == transposer.find_best_window(events)
+    
+    def test_filter_carries_dropped_time(self, transposer: Transposer):
+        """Time from dropped notes and note-offs should carry to the next kept note."""
+        events = [
+            NoteEvent(note=60, velocity=100, time_delta=0.0),
+            NoteEvent(note=60, velocity=0, time_delta=0.25, is_note_on=False),
+            NoteEvent(note=20, velocity=100, time_delta=0.5),
+            NoteEvent(note=62, velocity=100, time_delta=0.25),
+        ]
+        result = transposer.filter_to_window(events, 48)
+        assert [e.note for e in result] == [60, 62]
+        assert result[1].time_delta == pytest.approx(1.0)
+    
+    def test_window_matches_per_note_count(self, transposer: Transposer):
+        """The histogram search should agree with counting notes per window."""
+        pattern = (20, 21, 21, 40, 55, 55, 56, 70, 90, 91, 91, 91, 110, 127)
+        events = [NoteEvent(note=n, velocity=100, time_delta=0.1) for n in pattern]
+        events.append(NoteEvent(note=91, velocity=0, time_delta=0.1, is_note_on=False))
+        
+        notes = [e.note for e in events if e.is_note_on]
+        best_start, best_count = min(notes), 0
+        for start in range(min(notes), max(notes) - 34):
+            count = sum(1 for n in notes if start <= n <= start + 35)
+            if count > best_count:
+                best_start, best_count = start, count
+        
+        assert transposer.find_best_window(events) == (best_start, best_count)
@@ -25,6 +25,7 @@ a = Analysis(
         'pynput.keyboard._win32',
         'autobard',
         'autobard.config',
+        'autobard.entry',
         'autobard.app',
         'autobard.gui',
         'autobard.gui.modern_window',